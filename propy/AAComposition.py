@@ -34,7 +34,8 @@ References
 """
 
 # Core Library
-import re
+from collections import Counter
+from operator import add
 from typing import Any, Dict, List
 
 # First party
@@ -88,12 +89,18 @@ def CalculateDipeptideComposition(ProteinSequence: str) -> Dict[str, float]:
     >>> result = CalculateDipeptideComposition(protein)
     """
     sequence_length = len(ProteinSequence)
+    # Count all adjacent pairs in one pass. This matches str.count except
+    # for homodipeptides, where str.count does not count overlaps ("AAA"
+    # contains "AA" once), so those are counted with str.count.
+    counts = Counter(map(add, ProteinSequence, ProteinSequence[1:]))
+    for i in AALetter:
+        counts[i + i] = ProteinSequence.count(i + i)
     result = {}
     for i in AALetter:
         for j in AALetter:
             dipeptide = i + j
             result[dipeptide] = round(
-                float(ProteinSequence.count(dipeptide)) / (sequence_length - 1) * 100, 2
+                float(counts[dipeptide]) / (sequence_length - 1) * 100, 2
             )
     return result
 
@@ -138,13 +145,22 @@ def GetSpectrumDict(proteinsequence: str) -> Dict[str, int]:
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = GetSpectrumDict(protein)
     """
-    result = {}
-    kmers = Getkmers()
-    for i in kmers:
-        result[i] = len(re.findall(i, proteinsequence))
+    # As for dipeptides, count all windows in one pass. Only 3-mers whose
+    # first and last residue agree can overlap themselves, so those keep the
+    # non-overlapping str.count semantics.
+    counts = Counter(
+        map(add, map(add, proteinsequence, proteinsequence[1:]), proteinsequence[2:])
+    )
+    result = {i: counts[i] for i in _Kmers}
+    for i in _SelfOverlappingKmers:
+        result[i] = proteinsequence.count(i)
     return result
 
 
+_Kmers = tuple(Getkmers())
+_SelfOverlappingKmers = tuple(kmer for kmer in _Kmers if kmer[0] == kmer[2])
+
+
 def CalculateAADipeptideComposition(ProteinSequence: str) -> Dict[str, float]:
     """
     Calculate the composition of AADs, dipeptide and 3-mers for a given protein
@@ -25,10 +25,7 @@ from the aaindex database.
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional, Type, cast
-
-# Third party
-import pkg_resources
+from typing import Any, Dict, List, Optional, Set, Type, cast
 
 # First party
 from propy import AALetter
@@ -38,6 +35,9 @@ logger = logging.getLogger(__name__)
 
 _aaindex: Dict[Any, Any] = {}
 
+# The files which init() has already read into _aaindex
+_parsed: Set[str] = set()
+
 
 class Record:
     """Amino acid index (AAindex) Record."""
@@ -170,19 +170,26 @@ def init(path: Optional[str] = None, index: str = "123"):
     Read in the aaindex files. You need to run this (once) before you can
     access any records. If the files are not within the current directory, you
     need to specify the correct directory path. By default all three aaindex
-    files are read in.
+    files are read in. Files which were already read in are skipped.
     """
     index = str(index)
     if path is None:
-        filepath = pkg_resources.resource_filename(__name__, "aaindex1")
-        path = os.path.dirname(filepath)
+        path = os.path.dirname(__file__)
         print("path =", path, file=sys.stderr)
     if "1" in index:
-        _parse(os.path.join(path, "aaindex1"), Record)
+        _parse_once(os.path.join(path, "aaindex1"), Record)
     if "2" in index:
-        _parse(os.path.join(path, "aaindex2"), MatrixRecord)
+        _parse_once(os.path.join(path, "aaindex2"), MatrixRecord)
     if "3" in index:
-        _parse(os.path.join(path, "aaindex3"), MatrixRecord)
+        _parse_once(os.path.join(path, "aaindex3"), MatrixRecord)
+
+
+def _parse_once(filename: str, rec: Type[Record]) -> None:
+    """Parse the aaindex input file unless it was already parsed."""
+    filename = os.path.abspath(filename)
+    if filename not in _parsed:
+        _parse(filename, rec)
+        _parsed.add(filename)
 
 
 def init_from_file(filename, type=Record):
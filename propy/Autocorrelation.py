@@ -39,48 +39,23 @@ References
 """
 
 # Core Library
-import json
 import math
+from operator import mul, sub
 from typing import Any, Dict, List
 
-# Third party
-from pkg_resources import resource_filename
+# First party
+from propy import _LoadData
 
 AALetter: List[str] = list("ARNDCQEGHILKMFPSTWYV")
 
-filepath = resource_filename(__name__, "data/hydrophobicity-autocorrelation.json")
-with open(filepath, "r") as f:
-    _Hydrophobicity: Dict[str, float] = json.load(f)
-
-filepath = resource_filename(__name__, "data/AvFlexibility.json")
-with open(filepath, "r") as f:
-    _AvFlexibility: Dict[str, float] = json.load(f)
-
-filepath = resource_filename(__name__, "data/Polarizability.json")
-with open(filepath, "r") as f:
-    _Polarizability: Dict[str, float] = json.load(f)
-
-filepath = resource_filename(__name__, "data/FreeEnergy.json")
-with open(filepath, "r") as f:
-    _FreeEnergy: Dict[str, float] = json.load(f)
-
-filepath = resource_filename(__name__, "data/ResidueASA.json")
-with open(filepath, "r") as f:
-    _ResidueASA: Dict[str, float] = json.load(f)
-
-
-filepath = resource_filename(__name__, "data/ResidueVol.json")
-with open(filepath, "r") as f:
-    _ResidueVol: Dict[str, float] = json.load(f)
-
-
-filepath = resource_filename(__name__, "data/Steric.json")
-with open(filepath, "r") as f:
-    _Steric: Dict[str, float] = json.load(f)
-
-filepath = resource_filename(__name__, "data/Mutability.json")
-with open(filepath, "r") as f:
-    _Mutability: Dict[str, float] = json.load(f)
+_Hydrophobicity: Dict[str, float] = _LoadData("hydrophobicity-autocorrelation.json")
+_AvFlexibility: Dict[str, float] = _LoadData("AvFlexibility.json")
+_Polarizability: Dict[str, float] = _LoadData("Polarizability.json")
+_FreeEnergy: Dict[str, float] = _LoadData("FreeEnergy.json")
+_ResidueASA: Dict[str, float] = _LoadData("ResidueASA.json")
+_ResidueVol: Dict[str, float] = _LoadData("ResidueVol.json")
+_Steric: Dict[str, float] = _LoadData("Steric.json")
+_Mutability: Dict[str, float] = _LoadData("Mutability.json")
 
 
 # Properties of AADs to compute the descriptors of protein sequence can
@@ -118,7 +93,7 @@ def _mean(listvalue):
 def _std(listvalue, ddof=1):
     """The standard deviation of the list data."""
     mean = _mean(listvalue)
-    temp = [math.pow(i - mean, 2) for i in listvalue]
+    temp = [(i - mean) * (i - mean) for i in listvalue]
     res = math.sqrt(sum(temp) / (len(listvalue) - ddof))
     return res
 
@@ -137,16 +112,14 @@ def NormalizeEachAAP(AAP: Dict[Any, Any]) -> Dict[Any, Any]:
     result : Dict
         contains the normalized properties of 20 amino acids
     """
-    if len(list(AAP.values())) != 20:
-        print("You can not input the correct number of properities of Amino acids!")
-    else:
-        result: Dict[Any, Any] = {}
-        for i, j in list(AAP.items()):
-            result[i] = (j - _mean(list(AAP.values()))) / _std(
-                list(AAP.values()), ddof=0
-            )
-
-    return result
+    if len(AAP) != 20:
+        raise ValueError(
+            "You can not input the correct number of properities of Amino acids!"
+        )
+    values = list(AAP.values())
+    mean = _mean(values)
+    std = _std(values, ddof=0)
+    return {i: (j - mean) / std for i, j in AAP.items()}
 
 
 def CalculateEachNormalizedMoreauBrotoAuto(
@@ -179,11 +152,12 @@ def CalculateEachNormalizedMoreauBrotoAuto(
     """
     AAPdic = NormalizeEachAAP(AAP)
 
+    # The property values are shared by all lags
+    values = [AAPdic[char] for char in ProteinSequence]
+
     result = {}
     for i in range(1, 31):
-        temp = 0
-        for j in range(len(ProteinSequence) - i):
-            temp = temp + AAPdic[ProteinSequence[j]] * AAPdic[ProteinSequence[j + 1]]
+        temp = sum(map(mul, values[: max(len(ProteinSequence) - i, 0)], values[1:]))
         if len(ProteinSequence) - i == 0:
             result["MoreauBrotoAuto" + AAPName + str(i)] = round(
                 temp / (len(ProteinSequence)), 3
@@ -235,13 +209,12 @@ def CalculateEachMoranAuto(
 
     K = (_std(cc, ddof=0)) ** 2
 
+    # The centered property values are shared by all lags
+    centered = [value - Pmean for value in cc]
+
     result = {}
     for i in range(1, 31):
-        temp = 0
-        for j in range(len(ProteinSequence) - i):
-            temp = temp + (AAPdic[ProteinSequence[j]] - Pmean) * (
-                AAPdic[ProteinSequence[j + i]] - Pmean
-            )
+        temp = sum(map(mul, centered, centered[i:]))
         if len(ProteinSequence) - i == 0:
             result["MoranAuto" + AAPName + str(i)] = round(
                 temp / (len(ProteinSequence)) / K, 3
@@ -291,12 +264,8 @@ def CalculateEachGearyAuto(
     K = ((_std(cc)) ** 2) * len(ProteinSequence) / (len(ProteinSequence) - 1)
     result = {}
     for i in range(1, 31):
-        temp = 0
-        for j in range(len(ProteinSequence) - i):
-            temp = (
-                temp
-                + (AAPdic[ProteinSequence[j]] - AAPdic[ProteinSequence[j + i]]) ** 2
-            )
+        diffs = list(map(sub, cc, cc[i:]))
+        temp = sum(map(mul, diffs, diffs))
         if len(ProteinSequence) - i == 0:
             result["GearyAuto" + AAPName + str(i)] = round(
                 temp / (2 * (len(ProteinSequence))) / K, 3
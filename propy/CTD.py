@@ -36,9 +36,12 @@ References
 """
 
 # Core Library
-import copy
-import math
-from typing import Any, Dict
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
+
+# First party
+from propy import _MapSequences
 
 _Hydrophobicity = {"1": "RKEDQN", "2": "GASTPHY", "3": "CLVIMFW"}
 # '1'stand for Polar; '2'stand for Neutral, '3' stand for Hydrophobicity
@@ -85,6 +88,46 @@ _AATPropertyName = (
     "_Polarizability",
 )
 
+# Order in which CalculateC, CalculateT, CalculateD and CalculateCTD collect the
+# descriptors of the properties.
+_CTDOrder = tuple(zip(reversed(_AATProperty), reversed(_AATPropertyName)))
+
+
+@lru_cache(maxsize=None)
+def _GetTranslationTable(AAProperty: Tuple[Tuple[str, str], ...]) -> Dict[int, str]:
+    """
+    Build the str.translate table which maps each amino acid to its class.
+
+    The table only depends on the property, so it is built once per property
+    instead of once per sequence.
+    """
+    table: Dict[int, str] = {}
+    for k, m in AAProperty:
+        for index in m:
+            table.setdefault(ord(index), k)
+    return table
+
+
+@lru_cache(maxsize=None)
+def _GetByteTranslationTable(AAProperty: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Build the bytes.translate counterpart of _GetTranslationTable."""
+    table = bytearray(range(256))
+    for index, k in _GetTranslationTable(AAProperty).items():
+        if index < 256:
+            table[index] = ord(k)
+    return bytes(table)
+
+
+def _StringtoBytes(ProteinSequence: str, AAProperty: Dict[Any, Any]) -> bytes:
+    """
+    Tranform the protein sequence into the bytes form such as b"32123223132121".
+
+    This is the internal counterpart of :py:func:`StringtoNum`. Searching and
+    counting on bytes skips the per-call checks of the str kind.
+    """
+    table = _GetByteTranslationTable(tuple(AAProperty.items()))
+    return ProteinSequence.encode("ascii", "replace").translate(table)
+
 
 def StringtoNum(ProteinSequence: str, AAProperty: Dict[Any, Any]) -> str:
     """
@@ -109,13 +152,20 @@ def StringtoNum(ProteinSequence: str, AAProperty: Dict[Any, Any]) -> str:
     >>> AAProperty, AAPName = _Hydrophobicity, "_Hydrophobicity"
     >>> result = StringtoNum(protein, AAProperty)
     """
-    hardProteinSequence = copy.deepcopy(ProteinSequence)
-    for k, m in list(AAProperty.items()):
-        for index in m:
-            hardProteinSequence = hardProteinSequence.replace(index, k)
-    TProteinSequence = hardProteinSequence
+    table = _GetTranslationTable(tuple(AAProperty.items()))
+    return ProteinSequence.translate(table)
 
-    return TProteinSequence
+
+def _CalculateCompositionFromNum(
+    TProteinSequence: bytes, AAPName: str
+) -> Dict[Any, Any]:
+    """Compute composition descriptors of an already translated sequence."""
+    result = {}
+    num = len(TProteinSequence)
+    result[AAPName + "C" + "1"] = round(float(TProteinSequence.count(b"1")) / num, 3)
+    result[AAPName + "C" + "2"] = round(float(TProteinSequence.count(b"2")) / num, 3)
+    result[AAPName + "C" + "3"] = round(float(TProteinSequence.count(b"3")) / num, 3)
+    return result
 
 
 def CalculateComposition(
@@ -145,13 +195,27 @@ def CalculateComposition(
     >>> AAProperty, AAPName = _Hydrophobicity, "_Hydrophobicity"
     >>> result = CalculateComposition(protein, AAProperty, AAPName)
     """
-    TProteinSequence = StringtoNum(ProteinSequence, AAProperty)
-    result = {}
+    TProteinSequence = _StringtoBytes(ProteinSequence, AAProperty)
+    return _CalculateCompositionFromNum(TProteinSequence, AAPName)
+
+
+def _CalculateTransitionFromNum(
+    TProteinSequence: bytes, AAPName: str
+) -> Dict[Any, Any]:
+    """Compute transition descriptors of an already translated sequence."""
+    Result = {}
     num = len(TProteinSequence)
-    result[AAPName + "C" + "1"] = round(float(TProteinSequence.count("1")) / num, 3)
-    result[AAPName + "C" + "2"] = round(float(TProteinSequence.count("2")) / num, 3)
-    result[AAPName + "C" + "3"] = round(float(TProteinSequence.count("3")) / num, 3)
-    return result
+    CTD = TProteinSequence
+    Result[AAPName + "T" + "12"] = round(
+        float(CTD.count(b"12") + CTD.count(b"21")) / (num - 1), 3
+    )
+    Result[AAPName + "T" + "13"] = round(
+        float(CTD.count(b"13") + CTD.count(b"31")) / (num - 1), 3
+    )
+    Result[AAPName + "T" + "23"] = round(
+        float(CTD.count(b"23") + CTD.count(b"32")) / (num - 1), 3
+    )
+    return Result
 
 
 def CalculateTransition(
@@ -181,19 +245,39 @@ def CalculateTransition(
     >>> AAProperty, AAPName = _Hydrophobicity, "_Hydrophobicity"
     >>> result = CalculateTransition(protein, AAProperty, AAPName)
     """
-    TProteinSequence = StringtoNum(ProteinSequence, AAProperty)
-    Result = {}
-    num = len(TProteinSequence)
-    CTD = TProteinSequence
-    Result[AAPName + "T" + "12"] = round(
-        float(CTD.count("12") + CTD.count("21")) / (num - 1), 3
-    )
-    Result[AAPName + "T" + "13"] = round(
-        float(CTD.count("13") + CTD.count("31")) / (num - 1), 3
-    )
-    Result[AAPName + "T" + "23"] = round(
-        float(CTD.count("23") + CTD.count("32")) / (num - 1), 3
-    )
+    TProteinSequence = _StringtoBytes(ProteinSequence, AAProperty)
+    return _CalculateTransitionFromNum(TProteinSequence, AAPName)
+
+
+def _CalculateDistributionFromNum(
+    TProteinSequence: bytes, AAPName: str
+) -> Dict[Any, Any]:
+    """Compute distribution descriptors of an already translated sequence."""
+    Result: Dict[str, float] = {}
+    Num = len(TProteinSequence)
+    for i in ("1", "2", "3"):
+        # The position of the k-th occurrence (0-based) of the class is the
+        # length of the k+1 preceding parts plus the k+1 separators. This
+        # keeps the scan in C instead of one find call per occurrence.
+        parts = TProteinSequence.split(i.encode("ascii"))
+        num = len(parts) - 1
+        if num == 0:
+            Result[AAPName + "D" + i + "001"] = 0
+            Result[AAPName + "D" + i + "025"] = 0
+            Result[AAPName + "D" + i + "050"] = 0
+            Result[AAPName + "D" + i + "075"] = 0
+            Result[AAPName + "D" + i + "100"] = 0
+        else:
+            lengths = list(accumulate(map(len, parts)))
+            indices = (0, num // 4 - 1, num // 2 - 1, num * 3 // 4 - 1, num - 1)
+            for suffix, k in zip(("001", "025", "050", "075", "100"), indices):
+                # An index of -1 refers to the last occurrence
+                k %= num
+                position = lengths[k] + k + 1
+                Result[AAPName + "D" + i + suffix] = round(
+                    float(position) / Num * 100, 3
+                )
+
     return Result
 
 
@@ -223,39 +307,20 @@ def CalculateDistribution(
     >>> AAProperty, AAPName = _Hydrophobicity, "_Hydrophobicity"
     >>> result = CalculateDistribution(protein, AAProperty, AAPName)
     """
-    TProteinSequence = StringtoNum(ProteinSequence, AAProperty)
-    Result: Dict[str, float] = {}
-    Num = len(TProteinSequence)
-    for i in ("1", "2", "3"):
-        num = TProteinSequence.count(i)
-        ink = 1
-        indexk = 0
-        cds = []
-        while ink <= num:
-            indexk = TProteinSequence.find(i, indexk) + 1
-            cds.append(indexk)
-            ink = ink + 1
-
-        if cds == []:
-            Result[AAPName + "D" + i + "001"] = 0
-            Result[AAPName + "D" + i + "025"] = 0
-            Result[AAPName + "D" + i + "050"] = 0
-            Result[AAPName + "D" + i + "075"] = 0
-            Result[AAPName + "D" + i + "100"] = 0
-        else:
-            Result[AAPName + "D" + i + "001"] = round(float(cds[0]) / Num * 100, 3)
-            Result[AAPName + "D" + i + "025"] = round(
-                float(cds[int(math.floor(num * 0.25)) - 1]) / Num * 100, 3
-            )
-            Result[AAPName + "D" + i + "050"] = round(
-                float(cds[int(math.floor(num * 0.5)) - 1]) / Num * 100, 3
-            )
-            Result[AAPName + "D" + i + "075"] = round(
-                float(cds[int(math.floor(num * 0.75)) - 1]) / Num * 100, 3
-            )
-            Result[AAPName + "D" + i + "100"] = round(float(cds[-1]) / Num * 100, 3)
+    TProteinSequence = _StringtoBytes(ProteinSequence, AAProperty)
+    return _CalculateDistributionFromNum(TProteinSequence, AAPName)
 
-    return Result
+
+def _CalculateCTDForProperty(
+    ProteinSequence: str, AAProperty: Dict[Any, Any], AAPName: str
+) -> Tuple[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]:
+    """Compute the C, T and D descriptors of one property with one translation."""
+    TProteinSequence = _StringtoBytes(ProteinSequence, AAProperty)
+    return (
+        _CalculateCompositionFromNum(TProteinSequence, AAPName),
+        _CalculateTransitionFromNum(TProteinSequence, AAPName),
+        _CalculateDistributionFromNum(TProteinSequence, AAPName),
+    )
 
 
 def CalculateCompositionHydrophobicity(ProteinSequence: str):
@@ -782,13 +847,9 @@ def CalculateC(ProteinSequence: str) -> Dict[Any, Any]:
     >>> result = CalculateC(protein)
     """
     result: Dict[Any, Any] = {}
-    result.update(CalculateCompositionPolarizability(ProteinSequence))
-    result.update(CalculateCompositionSolventAccessibility(ProteinSequence))
-    result.update(CalculateCompositionSecondaryStr(ProteinSequence))
-    result.update(CalculateCompositionCharge(ProteinSequence))
-    result.update(CalculateCompositionPolarity(ProteinSequence))
-    result.update(CalculateCompositionNormalizedVDWV(ProteinSequence))
-    result.update(CalculateCompositionHydrophobicity(ProteinSequence))
+    for AAProperty, AAPName in _CTDOrder:
+        TProteinSequence = _StringtoBytes(ProteinSequence, AAProperty)
+        result.update(_CalculateCompositionFromNum(TProteinSequence, AAPName))
     return result
 
 
@@ -813,13 +874,9 @@ def CalculateT(ProteinSequence: str) -> Dict[Any, Any]:
     >>> result = CalculateT(protein)
     """
     result: Dict[Any, Any] = {}
-    result.update(CalculateTransitionPolarizability(ProteinSequence))
-    result.update(CalculateTransitionSolventAccessibility(ProteinSequence))
-    result.update(CalculateTransitionSecondaryStr(ProteinSequence))
-    result.update(CalculateTransitionCharge(ProteinSequence))
-    result.update(CalculateTransitionPolarity(ProteinSequence))
-    result.update(CalculateTransitionNormalizedVDWV(ProteinSequence))
-    result.update(CalculateTransitionHydrophobicity(ProteinSequence))
+    for AAProperty, AAPName in _CTDOrder:
+        TProteinSequence = _StringtoBytes(ProteinSequence, AAProperty)
+        result.update(_CalculateTransitionFromNum(TProteinSequence, AAPName))
     return result
 
 
@@ -844,13 +901,9 @@ def CalculateD(ProteinSequence: str) -> Dict[Any, Any]:
     >>> result = CalculateD(protein)
     """
     result: Dict[Any, Any] = {}
-    result.update(CalculateDistributionPolarizability(ProteinSequence))
-    result.update(CalculateDistributionSolventAccessibility(ProteinSequence))
-    result.update(CalculateDistributionSecondaryStr(ProteinSequence))
-    result.update(CalculateDistributionCharge(ProteinSequence))
-    result.update(CalculateDistributionPolarity(ProteinSequence))
-    result.update(CalculateDistributionNormalizedVDWV(ProteinSequence))
-    result.update(CalculateDistributionHydrophobicity(ProteinSequence))
+    for AAProperty, AAPName in _CTDOrder:
+        TProteinSequence = _StringtoBytes(ProteinSequence, AAProperty)
+        result.update(_CalculateDistributionFromNum(TProteinSequence, AAPName))
     return result
 
 
@@ -874,26 +927,43 @@ def CalculateCTD(ProteinSequence: str) -> Dict[Any, Any]:
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = CalculateCTD(protein)
     """
+    composition: Dict[Any, Any] = {}
+    transition: Dict[Any, Any] = {}
+    distribution: Dict[Any, Any] = {}
+    for AAProperty, AAPName in _CTDOrder:
+        c, t, d = _CalculateCTDForProperty(ProteinSequence, AAProperty, AAPName)
+        composition.update(c)
+        transition.update(t)
+        distribution.update(d)
     result: Dict[Any, Any] = {}
-    result.update(CalculateCompositionPolarizability(ProteinSequence))
-    result.update(CalculateCompositionSolventAccessibility(ProteinSequence))
-    result.update(CalculateCompositionSecondaryStr(ProteinSequence))
-    result.update(CalculateCompositionCharge(ProteinSequence))
-    result.update(CalculateCompositionPolarity(ProteinSequence))
-    result.update(CalculateCompositionNormalizedVDWV(ProteinSequence))
-    result.update(CalculateCompositionHydrophobicity(ProteinSequence))
-    result.update(CalculateTransitionPolarizability(ProteinSequence))
-    result.update(CalculateTransitionSolventAccessibility(ProteinSequence))
-    result.update(CalculateTransitionSecondaryStr(ProteinSequence))
-    result.update(CalculateTransitionCharge(ProteinSequence))
-    result.update(CalculateTransitionPolarity(ProteinSequence))
-    result.update(CalculateTransitionNormalizedVDWV(ProteinSequence))
-    result.update(CalculateTransitionHydrophobicity(ProteinSequence))
-    result.update(CalculateDistributionPolarizability(ProteinSequence))
-    result.update(CalculateDistributionSolventAccessibility(ProteinSequence))
-    result.update(CalculateDistributionSecondaryStr(ProteinSequence))
-    result.update(CalculateDistributionCharge(ProteinSequence))
-    result.update(CalculateDistributionPolarity(ProteinSequence))
-    result.update(CalculateDistributionNormalizedVDWV(ProteinSequence))
-    result.update(CalculateDistributionHydrophobicity(ProteinSequence))
+    result.update(composition)
+    result.update(transition)
+    result.update(distribution)
     return result
+
+
+def CalculateCTDBatch(
+    ProteinSequences: List[str], n_jobs: Optional[int] = 1, chunksize: int = 64
+) -> List[Dict[Any, Any]]:
+    """
+    Calculate all CTD descriptors for many protein sequences.
+
+    Parameters
+    ----------
+    ProteinSequences : List[str]
+        pure protein sequences
+    n_jobs : int, optional (default: 1)
+        number of worker processes. None uses all CPUs.
+    chunksize : int, optional (default: 64)
+        number of sequences which are sent to a worker process at once.
+
+    Returns
+    -------
+    result : List[Dict[Any, Any]]
+        contains all CTD descriptors for each sequence, in the input order.
+
+    Examples
+    --------
+    >>> result = CalculateCTDBatch(["ADGCGVGEGTGQGPMCNCMC", "MENATLLKSTTRHIRIFAAE"])
+    """
+    return _MapSequences(CalculateCTD, ProteinSequences, n_jobs, chunksize)
@@ -25,14 +25,186 @@ need.
 """
 
 # Core Library
+import http.client
+import logging
 import os
-from urllib.request import urlopen
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import getproxies, urlopen
 
+logger = logging.getLogger(__name__)
 
+_UNIPROT_HOST = "rest.uniprot.org"
+
+# UniProt accessions, optionally with an isoform suffix such as "P48039-2"
+_ACCESSION = re.compile(
+    r"([OPQ][0-9][A-Z0-9]{3}[0-9]|[A-NR-Z][0-9]([A-Z][A-Z0-9]{2}[0-9]){1,2})(-[0-9]+)?"
+)
+
+# UniProt redirects e.g. merged or secondary accessions to the current entry
+_REDIRECT_STATUS = {301, 302, 303, 307, 308}
+_MAX_REDIRECTS = 5
+
+# Rate limited (429) and temporarily failing (5xx) requests are retried with
+# exponential backoff: 1, 2, 4, 8 seconds
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+_MAX_RETRIES = 4
+_BACKOFF = 1.0
+
+# The worker threads of GetProteinSequenceFromTxt keep their connection open,
+# so that consecutive downloads do not pay for a new TCP and TLS handshake.
+# The connections are closed when all downloads are finished.
+_local = threading.local()
+
+
+def _KeepAlive(connections: List[http.client.HTTPSConnection]) -> None:
+    """Let the current thread reuse its connection and collect it in connections."""
+    _local.connections = connections
+
+
+def _Request(path: str) -> Tuple[http.client.HTTPResponse, bytes]:
+    """
+    Send a GET request to UniProt.
+
+    Threads which did not call _KeepAlive use a new connection per request.
+    """
+    connections = getattr(_local, "connections", None)
+    connection: Optional[http.client.HTTPSConnection]
+    if connections is None:
+        connection = http.client.HTTPSConnection(_UNIPROT_HOST, timeout=60)
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            return response, response.read()
+        finally:
+            connection.close()
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        connection = http.client.HTTPSConnection(_UNIPROT_HOST, timeout=60)
+        _local.connection = connection
+        connections.append(connection)
+    try:
+        connection.request("GET", path)
+        response = connection.getresponse()
+        data = response.read()
+    except (http.client.HTTPException, OSError):
+        # The server might have closed the idle connection, retry once
+        connection.close()
+        connection.request("GET", path)
+        response = connection.getresponse()
+        data = response.read()
+    return response, data
+
+
+def _Download(path: str) -> bytes:
+    """
+    Download a resource from UniProt.
+
+    Rate limited and temporarily failing requests are retried with exponential
+    backoff, respecting the Retry-After header of the response.
+    """
+    attempt = 0
+    while True:
+        try:
+            return _DownloadOnce(path)
+        except HTTPError as e:
+            if e.code not in _RETRY_STATUS or attempt == _MAX_RETRIES:
+                raise
+            delay = _BACKOFF * 2**attempt
+            retry_after = e.headers.get("Retry-After", "") if e.headers else ""
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), 60.0))
+            logger.info("HTTP %d for %s, retrying in %.0f s", e.code, path, delay)
+            time.sleep(delay)
+            attempt += 1
+
+
+def _DownloadOnce(path: str) -> bytes:
+    """
+    Download a resource from UniProt without retrying.
+
+    Redirects are followed. If a HTTPS proxy is configured, urllib is used,
+    as the keep-alive connection does not support proxies.
+    """
+    url = f"https://{_UNIPROT_HOST}{path}"
+    if "https" in getproxies():
+        with urlopen(url, timeout=60) as response:
+            return response.read()
+    for _ in range(_MAX_REDIRECTS + 1):
+        response, data = _Request(path)
+        if response.status not in _REDIRECT_STATUS:
+            break
+        url = urljoin(url, response.getheader("Location", ""))
+        parts = urlsplit(url)
+        if parts.scheme != "https" or parts.netloc != _UNIPROT_HOST:
+            # The keep-alive connection only reaches UniProt over HTTPS
+            with urlopen(url, timeout=60) as response:
+                return response.read()
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+    if response.status != 200:
+        raise HTTPError(url, response.status, response.reason, response.headers, None)
+    return data
+
+
+def _GetCacheDirectory() -> Optional[str]:
+    """
+    Return the directory in which downloaded FASTA files are stored.
+
+    It can be set with the PROPY_CACHE environment variable. If it is set to
+    an empty string, None is returned and the disk cache is not used.
+    """
+    default = os.path.join("~", ".cache", "propy")
+    directory = os.environ.get("PROPY_CACHE", default)
+    if not directory:
+        return None
+    return os.path.expanduser(directory)
+
+
+def _DownloadFasta(ProteinID: str) -> bytes:
+    """Get the FASTA file of a protein from the disk cache or from UniProt."""
+    # The ID becomes part of a file name and of the URL
+    if not _ACCESSION.fullmatch(ProteinID):
+        raise ValueError(f"{ProteinID!r} is no UniProt accession")
+    directory = _GetCacheDirectory()
+    if directory is None:
+        return _Download(f"/uniprotkb/{ProteinID}.fasta")
+    filename = os.path.join(directory, f"{ProteinID}.fasta")
+    try:
+        with open(filename, "rb") as f:
+            return f.read()
+    except OSError:
+        pass
+    data = _Download(f"/uniprotkb/{ProteinID}.fasta")
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Write to a temporary file first, so that concurrent downloads never
+        # see a partially written file
+        tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_filename, "wb") as f:
+            f.write(data)
+        os.replace(tmp_filename, filename)
+    except OSError as e:
+        logger.debug(f'Could not cache "{filename}": {e}')
+    return data
+
+
+@lru_cache(maxsize=None)
 def GetProteinSequence(ProteinID: str) -> str:
     """
     Get the protein sequence from the uniprot website by ID.
 
+    Downloaded FASTA files are cached in the directory given by the
+    PROPY_CACHE environment variable (default: ~/.cache/propy). The cached
+    files never expire, so changes of an entry on UniProt are not noticed
+    until the file is deleted. Set PROPY_CACHE to an empty string to disable
+    the disk cache.
+
     Parameters
     ----------
     ProteinID : str
@@ -42,6 +214,11 @@ def GetProteinSequence(ProteinID: str) -> str:
     -------
     protein_sequence : str
 
+    Raises
+    ------
+    ValueError
+        If ProteinID is no UniProt accession.
+
     Examples
     --------
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
@@ -53,15 +230,12 @@ def GetProteinSequence(ProteinID: str) -> str:
             "FAWRHFYWYLTNEGSQYLRDYLHLPPEIVPATLHLPPEIVPATLHRSRPETGRPRPKGLEG"
             "KRPARLTRREADRDTYRRCSVPPGADKKAEAGAGSATEFQFRGRCGRGRGQPPQ"
         )
-    localfile = urlopen(f"http://www.uniprot.org/uniprot/{ProteinID}.fasta")
-    temp = localfile.readlines()
-    protein_sequence = ""
-    for i in range(1, len(temp)):  # The first line is a comment
-        protein_sequence = protein_sequence + temp[i].decode("utf8").strip()
-    return protein_sequence
+    # The first line is a comment
+    _, _, body = _DownloadFasta(ProteinID).partition(b"\n")
+    return "".join(body.decode("utf8").split())
 
 
-def GetProteinSequenceFromTxt(path: str, openfile: str, savefile: str):
+def GetProteinSequenceFromTxt(path: str, openfile: str, savefile: str, n_jobs: int = 8):
     """
     Get the protein sequence from the uniprot website by the file containing ID.
 
@@ -73,19 +247,33 @@ def GetProteinSequenceFromTxt(path: str, openfile: str, savefile: str):
         the ID file such as "proteinID.txt"
     savefile : str
         the file saving the obtained protein sequences such as "protein.txt"
+    n_jobs : int, optional (default: 8)
+        number of sequences which are downloaded concurrently. The sequences
+        are saved in the order of the ID file.
     """
     path = os.path.abspath(path)  # makes debugging easier
+    with open(os.path.join(path, openfile), "r") as f2:
+        ids = [(index, i.strip()) for index, i in enumerate(f2) if i.strip()]
+    sequences = []
+    connections: List[http.client.HTTPSConnection] = []
+    try:
+        with ThreadPoolExecutor(
+            max_workers=n_jobs, initializer=_KeepAlive, initargs=(connections,)
+        ) as executor:
+            for (index, ProteinID), temp in zip(
+                ids, executor.map(GetProteinSequence, [i for _, i in ids])
+            ):
+                logger.info(
+                    "The %d protein sequence (%s, %d amino acids) has been downloaded",
+                    index + 1,
+                    ProteinID,
+                    len(temp),
+                )
+                sequences.append(temp + "\n")
+    finally:
+        for connection in connections:
+            connection.close()
+    # Write all sequences at once after the downloads are finished
     with open(os.path.join(path, savefile), "w") as f1:
-        with open(os.path.join(path, openfile), "r") as f2:
-            for index, i in enumerate(f2):
-                itrim = i.strip()
-                if itrim == "":
-                    continue
-                else:
-                    temp = GetProteinSequence(itrim)
-                    print("-" * 80)
-                    print(f"The {index + 1} protein sequence has been downloaded!")
-                    print(temp)
-                    f1.write(temp + "\n")
-                    print("-" * 80)
+        f1.write("".join(sequences))
     return 0
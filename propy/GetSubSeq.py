@@ -24,21 +24,76 @@ Given a specific window size p, we can obtain all segments of length equal to
 """
 
 # Core Library
-import re
-from typing import List
+from functools import partial
+from typing import AnyStr, Callable, Iterator, List, Union
 
 # First party
-from propy import AALetter
+from propy import AASet
 
 
-def GetSubSequence(ProteinSequence: str, ToAA: str = "S", window: int = 3) -> List[str]:
+def IterSubSequence(
+    ProteinSequence: AnyStr, ToAA: str = "S", window: int = 3
+) -> Iterator[AnyStr]:
+    """
+    Iterate over all 2*window+1 sub-sequences whose center is ToAA in a protein.
+
+    This is the lazy counterpart of :py:func:`GetSubSequence`. Callers which
+    only process each sub-sequence once do not need to keep all of them in
+    memory.
+
+    Parameters
+    ----------
+    ProteinSequence : str or bytes
+        a pure problem sequence. If it is given as bytes, the sub-sequences
+        are bytes as well.
+    ToAA :str
+        the central (query point) amino acid in the sub-sequence
+    window : int
+        the span
+
+    Yields
+    ------
+    subsequence : str or bytes
+        a satisfied sub-sequence
+
+    Examples
+    --------
+    >>> from propy.GetProteinFromUniprot import GetProteinSequence
+    >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
+    >>> for subsequence in IterSubSequence(protein):
+    ...     pass
+    """
+    find: Callable[[int, int], int]
+    if isinstance(ProteinSequence, bytes):
+        center: Union[bytes, int] = (
+            ToAA.encode("ascii") if ToAA in AASet else ProteinSequence[1]
+        )
+        find = partial(ProteinSequence.find, center)
+    else:
+        find = partial(
+            ProteinSequence.find, ToAA if ToAA in AASet else ProteinSequence[1]
+        )
+
+    # Only centers with a full window on both sides are searched for
+    start = window
+    end = len(ProteinSequence) - window
+    index = find(start, end)
+    while index != -1:
+        yield ProteinSequence[index - window : index + window + 1]
+        index = find(index + 1, end)
+
+
+def GetSubSequence(
+    ProteinSequence: AnyStr, ToAA: str = "S", window: int = 3
+) -> List[AnyStr]:
     """
     Get all 2*window+1 sub-sequences whose cener is ToAA in a protein.
 
     Parameters
     ----------
-    ProteinSequence : str
-        a pure problem sequence
+    ProteinSequence : str or bytes
+        a pure problem sequence. If it is given as bytes, the sub-sequences
+        are bytes as well.
     ToAA :str
         the central (query point) amino acid in the sub-sequence
     window : int
@@ -46,7 +101,7 @@ def GetSubSequence(ProteinSequence: str, ToAA: str = "S", window: int = 3) -> Li
 
     Returns
     -------
-    result : List[str]
+    result : List[str] or List[bytes]
         contains all satisfied sub-sequences
 
     Examples
@@ -55,20 +110,4 @@ def GetSubSequence(ProteinSequence: str, ToAA: str = "S", window: int = 3) -> Li
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = GetSubSequence(protein)
     """
-
-    if ToAA not in AALetter:
-        ToAA = ProteinSequence[1]
-
-    Num = len(ProteinSequence)
-    seqiter = re.finditer(ToAA, ProteinSequence)
-    AAindex: List[int] = []
-    for seq_element in seqiter:
-        AAindex.append(seq_element.end())
-
-    result = []
-    for i in AAindex:
-        if i - window > 0 and Num - i + 1 - window > 0:
-            temp = ProteinSequence[i - window - 1 : i + window]
-            result.append(temp)
-
-    return result
+    return list(IterSubSequence(ProteinSequence, ToAA, window))
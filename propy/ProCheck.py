@@ -20,17 +20,24 @@
 Check whether the input protein sequence is a valid amino acid sequence.
 """
 
+# Core Library
+from typing import Union
+
 # First party
 from propy import AALetter
 
+# Deleting all valid amino acids leaves only the invalid characters
+_AABytes = "".join(AALetter).encode("ascii")
+
 
-def ProteinCheck(ProteinSequence: str) -> int:
+def ProteinCheck(ProteinSequence: Union[str, bytes]) -> int:
     """
     Check whether the protein sequence is a valid amino acid sequence or not.
 
     Parameters
     ----------
-    ProteinSequence : a pure protein sequence
+    ProteinSequence : str or bytes
+        a pure protein sequence
 
     Returns
     -------
@@ -44,12 +51,11 @@ def ProteinCheck(ProteinSequence: str) -> int:
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = ProteinCheck(protein)
     """
-    NumPro = len(ProteinSequence)
-    for i in ProteinSequence:
-        if i not in AALetter:
-            flag = 0
-            break
-        else:
-            flag = NumPro
-
-    return flag
+    if isinstance(ProteinSequence, str):
+        # Non-ASCII characters become "?", which is invalid as well
+        sequence = ProteinSequence.encode("ascii", "replace")
+    else:
+        sequence = ProteinSequence
+    if sequence.translate(None, _AABytes):
+        return 0
+    return len(ProteinSequence)
@@ -53,34 +53,22 @@ Clarendon Press Oxford (1986).
 """
 
 # Core Library
-import json
 import math
-from typing import Any, Dict
-
-# Third party
-from pkg_resources import resource_filename
+from functools import lru_cache, partial
+from itertools import chain
+from operator import getitem
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 # First party
-from propy import AALetter
-
-with open(resource_filename(__name__, "data/hydrophobicity.json"), "r") as f:
-    _Hydrophobicity: Dict[str, float] = json.load(f)
-
-with open(resource_filename(__name__, "data/hydrophilicity.json"), "r") as f:
-    _hydrophilicity: Dict[str, float] = json.load(f)
-
-with open(resource_filename(__name__, "data/residuemass.json"), "r") as f:
-    _residuemass: Dict[str, float] = json.load(f)
+from propy import AALetter, _LoadData, _MapSequences
 
+_Hydrophobicity: Dict[str, float] = _LoadData("hydrophobicity.json")
+_hydrophilicity: Dict[str, float] = _LoadData("hydrophilicity.json")
+_residuemass: Dict[str, float] = _LoadData("residuemass.json")
 
-with open(resource_filename(__name__, "data/pK1.json"), "r") as f:
-    _pK1: Dict[str, float] = json.load(f)
-
-with open(resource_filename(__name__, "data/pK2.json"), "r") as f:
-    _pK2: Dict[str, float] = json.load(f)
-
-with open(resource_filename(__name__, "data/pI.json"), "r") as f:
-    _pI: Dict[str, float] = json.load(f)
+_pK1: Dict[str, float] = _LoadData("pK1.json")
+_pK2: Dict[str, float] = _LoadData("pK2.json")
+_pI: Dict[str, float] = _LoadData("pI.json")
 
 
 def _mean(listvalue):
@@ -105,7 +93,7 @@ def _std(listvalue, ddof=1):
     1.0
     """
     mean = _mean(listvalue)
-    temp = [math.pow(i - mean, 2) for i in listvalue]
+    temp = [(i - mean) * (i - mean) for i in listvalue]
     res = math.sqrt(sum(temp) / (len(listvalue) - ddof))
     return res
 
@@ -128,23 +116,62 @@ def NormalizeEachAAP(AAP):
     --------
     >>> result = NormalizeEachAAP(AAP=_Hydrophobicity)
     """
-    if len(list(AAP.values())) != 20:
-        print("You can not input the correct number of properities of Amino acids!")
-    else:
-        result = {}
-        for i, j in list(AAP.items()):
-            result[i] = (j - _mean(list(AAP.values()))) / _std(
-                list(AAP.values()), ddof=0
-            )
+    if len(AAP) != 20:
+        raise ValueError(
+            "You can not input the correct number of properities of Amino acids!"
+        )
+    values = list(AAP.values())
+    mean = _mean(values)
+    std = _std(values, ddof=0)
+    return {i: (j - mean) / std for i, j in AAP.items()}
+
+
+@lru_cache(maxsize=None)
+def _NormalizeAAPItems(AAPItems: Tuple[Tuple[str, float], ...]) -> Dict[str, float]:
+    """Normalize the properties given as the items of a dict."""
+    return NormalizeEachAAP(dict(AAPItems))
+
+
+def _GetNormalizedAAP(AAP: Dict[str, float]) -> Dict[str, float]:
+    """
+    Get NormalizeEachAAP(AAP), which is only computed once per property.
+
+    The result is shared between the calls and must not be modified.
+    """
+    return _NormalizeAAPItems(tuple(AAP.items()))
 
-    return result
+
+def _GetNormalizedValues(AAP: Dict[str, float]) -> Tuple[float, ...]:
+    """Get the normalized property values in the order of AALetter."""
+    normalized = _GetNormalizedAAP(AAP)
+    return tuple(normalized[char] for char in AALetter)
+
+
+# The normalized built-in properties of type II in the order of AALetter
+_HydrophobicityValues = _GetNormalizedValues(_Hydrophobicity)
+_hydrophilicityValues = _GetNormalizedValues(_hydrophilicity)
+
+
+# Maps each amino acid to its index in AALetter and all other bytes to 255
+_AAIndexTable = bytes(
+    AALetter.index(chr(i)) if chr(i) in AALetter else 255 for i in range(256)
+)
+
+
+def _EncodeSequence(ProteinSequence: str) -> bytes:
+    """Encode the protein sequence as the indices of its amino acids in AALetter."""
+    codes = ProteinSequence.encode("ascii", "replace").translate(_AAIndexTable)
+    if 255 in codes:
+        position = codes.index(255)
+        raise ValueError(
+            f"Invalid amino acid {ProteinSequence[position]!r} at position {position}"
+        )
+    return codes
 
 
 # Type I descriptors###########################################################
 # Pseudo-Amino Acid Composition descriptors####################################
-def _GetCorrelationFunction(
-    Ri="S", Rj="D", AAP=(_Hydrophobicity, _hydrophilicity, _residuemass)
-):
+def _GetCorrelationFunction(Ri="S", Rj="D", AAP=None):
     """
     Computing the correlation between two given amino acids using the above
     three properties.
@@ -153,6 +180,9 @@ def _GetCorrelationFunction(
     ----------
     Ri and Rj are the amino acids, respectively.
 
+    AAP defaults to (_Hydrophobicity, _hydrophilicity, _residuemass). The
+    results for the default are cached, as there are only 400 pairs.
+
     Returns
     -------
     result is the correlation value between two amino acids.
@@ -161,16 +191,58 @@ def _GetCorrelationFunction(
     --------
     >>> result = _GetCorrelationFunction(Ri="S", Rj="D")
     """
-    Hydrophobicity = NormalizeEachAAP(AAP[0])
-    hydrophilicity = NormalizeEachAAP(AAP[1])
-    residuemass = NormalizeEachAAP(AAP[2])
-    theta1 = math.pow(Hydrophobicity[Ri] - Hydrophobicity[Rj], 2)
-    theta2 = math.pow(hydrophilicity[Ri] - hydrophilicity[Rj], 2)
-    theta3 = math.pow(residuemass[Ri] - residuemass[Rj], 2)
-    theta = round((theta1 + theta2 + theta3) / 3.0, 3)
+    if AAP is None:
+        return _GetDefaultCorrelationFunction(Ri, Rj)
+    Hydrophobicity = _GetNormalizedAAP(AAP[0])
+    hydrophilicity = _GetNormalizedAAP(AAP[1])
+    residuemass = _GetNormalizedAAP(AAP[2])
+    diff1 = Hydrophobicity[Ri] - Hydrophobicity[Rj]
+    diff2 = hydrophilicity[Ri] - hydrophilicity[Rj]
+    diff3 = residuemass[Ri] - residuemass[Rj]
+    theta1 = diff1 * diff1
+    theta2 = diff2 * diff2
+    theta3 = diff3 * diff3
+    theta = (theta1 + theta2 + theta3) / 3.0
     return theta
 
 
+@lru_cache(maxsize=512)
+def _GetDefaultCorrelationFunction(Ri: str, Rj: str) -> float:
+    """Compute _GetCorrelationFunction for the default properties."""
+    return _GetCorrelationFunction(
+        Ri, Rj, (_Hydrophobicity, _hydrophilicity, _residuemass)
+    )
+
+
+# The correlations of the amino acids with the indices i and j as table[i][j]
+_CorrelationTable = tuple(
+    tuple(_GetDefaultCorrelationFunction(Ri, Rj) for Rj in AALetter) for Ri in AALetter
+)
+
+
+def _GetCorrelationFactorFromTable(
+    codes: bytes, k: int, table: Tuple[Tuple[float, ...], ...]
+) -> float:
+    """Compute the correlation factor of an encoded sequence for a table."""
+    # table[AA1][AA2] for all pairs (AA1, AA2) with the gap k
+    rows = map(table.__getitem__, codes)
+    result = sum(map(getitem, rows, codes[k:])) / (len(codes) - k)
+    return result
+
+
+def _GetCorrelationFactorsFromTable(
+    codes: bytes, lamda: int, table: Tuple[Tuple[float, ...], ...]
+) -> List[float]:
+    """Compute the correlation factors for the gaps 1 to lamda for a table."""
+    # The rows of the first residues of the pairs are the same for all gaps
+    rows = list(map(table.__getitem__, codes))
+    LengthSequence = len(codes)
+    return [
+        sum(map(getitem, rows, codes[k:])) / (LengthSequence - k)
+        for k in range(1, lamda + 1)
+    ]
+
+
 def _GetSequenceOrderCorrelationFactor(ProteinSequence: str, k: int = 1) -> float:
     """
     Computing the Sequence order correlation factor with gap equal to k based
@@ -194,14 +266,21 @@ def _GetSequenceOrderCorrelationFactor(ProteinSequence: str, k: int = 1) -> floa
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = _GetSequenceOrderCorrelationFactor(protein)
     """
-    LengthSequence = len(ProteinSequence)
-    res = []
-    for i in range(LengthSequence - k):
-        AA1 = ProteinSequence[i]
-        AA2 = ProteinSequence[i + k]
-        res.append(_GetCorrelationFunction(AA1, AA2))
-    result = round(sum(res) / (LengthSequence - k), 3)
-    return result
+    return _GetCorrelationFactorFromTable(
+        _EncodeSequence(ProteinSequence), k, _CorrelationTable
+    )
+
+
+def _GetSequenceOrderCorrelationFactors(
+    ProteinSequence: str, lamda: int
+) -> List[float]:
+    """
+    Compute the sequence order correlation factors for the gaps 1 to lamda.
+
+    The sequence is only encoded once for all gaps.
+    """
+    codes = _EncodeSequence(ProteinSequence)
+    return _GetCorrelationFactorsFromTable(codes, lamda, _CorrelationTable)
 
 
 def GetAAComposition(ProteinSequence: str) -> Dict[Any, Any]:
@@ -230,17 +309,17 @@ def GetAAComposition(ProteinSequence: str) -> Dict[Any, Any]:
     return Result
 
 
-def _GetPseudoAAC1(ProteinSequence, lamda=10, weight=0.05):
+def _GetPseudoAAC1(ProteinSequence, lamda=10, weight=0.05, factors=None):
     """
     Computing the first 20 of type I pseudo-amino acid compostion descriptors based on
 
     [_Hydrophobicity, _hydrophilicity, _residuemass].
+
+    The correlation factors can be passed if they are already computed.
     """
-    rightpart = 0.0
-    for i in range(lamda):
-        rightpart = rightpart + _GetSequenceOrderCorrelationFactor(
-            ProteinSequence, k=i + 1
-        )
+    if factors is None:
+        factors = _GetSequenceOrderCorrelationFactors(ProteinSequence, lamda)
+    rightpart = sum(factors)
     AAC = GetAAComposition(ProteinSequence)
 
     result = {}
@@ -251,22 +330,20 @@ def _GetPseudoAAC1(ProteinSequence, lamda=10, weight=0.05):
     return result
 
 
-def _GetPseudoAAC2(ProteinSequence, lamda=10, weight=0.05):
+def _GetPseudoAAC2(ProteinSequence, lamda=10, weight=0.05, factors=None):
     """
     Computing the last lamda of type I pseudo-amino acid compostion descriptors based on
 
     [_Hydrophobicity, _hydrophilicity, _residuemass].
-    """
-    rightpart = []
-    for i in range(lamda):
-        rightpart.append(_GetSequenceOrderCorrelationFactor(ProteinSequence, k=i + 1))
 
+    The correlation factors can be passed if they are already computed.
+    """
+    if factors is None:
+        factors = _GetSequenceOrderCorrelationFactors(ProteinSequence, lamda)
     result = {}
-    temp = 1 + weight * sum(rightpart)
-    for index in range(20, 20 + lamda):
-        result["PAAC" + str(index + 1)] = round(
-            weight * rightpart[index - 20] / temp * 100, 3
-        )
+    temp = 1 + weight * sum(factors)
+    for index, factor in enumerate(factors, start=21):
+        result["PAAC" + str(index)] = round(weight * factor / temp * 100, 3)
 
     return result
 
@@ -310,17 +387,17 @@ def _GetPseudoAAC(
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = _GetPseudoAAC(protein)
     """
+    # Both parts need the same correlation factors
+    factors = _GetSequenceOrderCorrelationFactors(ProteinSequence, lamda)
     res: Dict[Any, Any] = {}
-    res.update(_GetPseudoAAC1(ProteinSequence, lamda=lamda, weight=weight))
-    res.update(_GetPseudoAAC2(ProteinSequence, lamda=lamda, weight=weight))
+    res.update(_GetPseudoAAC1(ProteinSequence, lamda, weight, factors))
+    res.update(_GetPseudoAAC2(ProteinSequence, lamda, weight, factors))
     return res
 
 
 # Type II descriptors##########################################################
 # Amphiphilic Pseudo-Amino Acid Composition descriptors########################
-def _GetCorrelationFunctionForAPAAC(
-    Ri="S", Rj="D", AAP=(_Hydrophobicity, _hydrophilicity)
-):
+def _GetCorrelationFunctionForAPAAC(Ri="S", Rj="D", AAP=None):
     """
     Computing the correlation between two given amino acids using the above two
     properties for APAAC (type II PseAAC).
@@ -329,6 +406,9 @@ def _GetCorrelationFunctionForAPAAC(
     ----------
     Ri and Rj are the amino acids, respectively.
 
+    AAP defaults to (_Hydrophobicity, _hydrophilicity). The results for the
+    default are cached, as there are only 400 pairs.
+
     Returns
     -------
     result :
@@ -338,14 +418,32 @@ def _GetCorrelationFunctionForAPAAC(
     --------
     >>> result = _GetCorrelationFunctionForAPAAC(Ri="S", Rj="D")
     """
-    Hydrophobicity = NormalizeEachAAP(AAP[0])
-    hydrophilicity = NormalizeEachAAP(AAP[1])
-    theta1 = round(Hydrophobicity[Ri] * Hydrophobicity[Rj], 3)
-    theta2 = round(hydrophilicity[Ri] * hydrophilicity[Rj], 3)
+    if AAP is None:
+        return _GetDefaultCorrelationFunctionForAPAAC(Ri, Rj)
+    Hydrophobicity = _GetNormalizedAAP(AAP[0])
+    hydrophilicity = _GetNormalizedAAP(AAP[1])
+    theta1 = Hydrophobicity[Ri] * Hydrophobicity[Rj]
+    theta2 = hydrophilicity[Ri] * hydrophilicity[Rj]
 
     return theta1, theta2
 
 
+@lru_cache(maxsize=512)
+def _GetDefaultCorrelationFunctionForAPAAC(Ri: str, Rj: str) -> Tuple[float, float]:
+    """Compute _GetCorrelationFunctionForAPAAC for the default properties."""
+    return _GetCorrelationFunctionForAPAAC(Ri, Rj, (_Hydrophobicity, _hydrophilicity))
+
+
+# The products of the properties of the amino acids with the indices i and j
+# as table[i][j]
+_HydrophobicityProductTable = tuple(
+    tuple(i * j for j in _HydrophobicityValues) for i in _HydrophobicityValues
+)
+_hydrophilicityProductTable = tuple(
+    tuple(i * j for j in _hydrophilicityValues) for i in _hydrophilicityValues
+)
+
+
 def GetSequenceOrderCorrelationFactorForAPAAC(ProteinSequence, k=1):
     """
     Computing the Sequence order correlation factor with gap equal to k based on
@@ -369,32 +467,49 @@ def GetSequenceOrderCorrelationFactorForAPAAC(ProteinSequence, k=1):
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = GetSequenceOrderCorrelationFactorForAPAAC(protein)
     """
-    LengthSequence = len(ProteinSequence)
-    resHydrophobicity = []
-    reshydrophilicity = []
-    for i in range(LengthSequence - k):
-        AA1 = ProteinSequence[i]
-        AA2 = ProteinSequence[i + k]
-        temp = _GetCorrelationFunctionForAPAAC(AA1, AA2)
-        resHydrophobicity.append(temp[0])
-        reshydrophilicity.append(temp[1])
+    return _GetCorrelationFactorForAPAACFromCodes(_EncodeSequence(ProteinSequence), k)
+
+
+def _GetCorrelationFactorForAPAACFromCodes(codes: bytes, k: int) -> List[float]:
+    """Compute GetSequenceOrderCorrelationFactorForAPAAC of an encoded sequence."""
     result = []
-    result.append(round(sum(resHydrophobicity) / (LengthSequence - k), 3))
-    result.append(round(sum(reshydrophilicity) / (LengthSequence - k), 3))
+    result.append(_GetCorrelationFactorFromTable(codes, k, _HydrophobicityProductTable))
+    result.append(_GetCorrelationFactorFromTable(codes, k, _hydrophilicityProductTable))
     return result
 
 
-def GetAPseudoAAC1(ProteinSequence, lamda=30, weight=0.5):
+def _GetSequenceOrderCorrelationFactorsForAPAAC(
+    ProteinSequence: str, lamda: int
+) -> List[List[float]]:
+    """
+    Compute the APAAC sequence order correlation factors for the gaps 1 to
+    lamda.
+
+    The sequence is only encoded once for all gaps.
+    """
+    codes = _EncodeSequence(ProteinSequence)
+    Hydrophobicity = _GetCorrelationFactorsFromTable(
+        codes, lamda, _HydrophobicityProductTable
+    )
+    hydrophilicity = _GetCorrelationFactorsFromTable(
+        codes, lamda, _hydrophilicityProductTable
+    )
+    return [list(factors) for factors in zip(Hydrophobicity, hydrophilicity)]
+
+
+def GetAPseudoAAC1(ProteinSequence, lamda=30, weight=0.5, factors=None):
     """
     Computing the first 20 of type II pseudo-amino acid compostion descriptors based on
 
     [_Hydrophobicity, _hydrophilicity].
+
+    The correlation factors can be passed if they are already computed.
     """
+    if factors is None:
+        factors = _GetSequenceOrderCorrelationFactorsForAPAAC(ProteinSequence, lamda)
     rightpart = 0.0
-    for i in range(lamda):
-        rightpart = rightpart + sum(
-            GetSequenceOrderCorrelationFactorForAPAAC(ProteinSequence, k=i + 1)
-        )
+    for factor in factors:
+        rightpart = rightpart + sum(factor)
     AAC = GetAAComposition(ProteinSequence)
 
     result = {}
@@ -405,29 +520,28 @@ def GetAPseudoAAC1(ProteinSequence, lamda=30, weight=0.5):
     return result
 
 
-def GetAPseudoAAC2(ProteinSequence, lamda=30, weight=0.5):
+def GetAPseudoAAC2(ProteinSequence, lamda=30, weight=0.5, factors=None):
     """
     Computing the last lamda of type II pseudo-amino acid compostion descriptors
 
     based on (_Hydrophobicity, _hydrophilicity).
-    """
-    rightpart = []
-    for i in range(lamda):
-        temp = GetSequenceOrderCorrelationFactorForAPAAC(ProteinSequence, k=i + 1)
-        rightpart.append(temp[0])
-        rightpart.append(temp[1])
 
+    The correlation factors can be passed if they are already computed.
+    """
+    if factors is None:
+        factors = _GetSequenceOrderCorrelationFactorsForAPAAC(ProteinSequence, lamda)
+    # The hydrophobicity and hydrophilicity factors alternate
     result = {}
-    temp = 1 + weight * sum(rightpart)
-    for index in range(20, 20 + 2 * lamda):
-        result["APAAC" + str(index + 1)] = round(
-            weight * rightpart[index - 20] / temp * 100, 3
-        )
+    temp = 1 + weight * sum(chain.from_iterable(factors))
+    for index, factor in enumerate(chain.from_iterable(factors), start=21):
+        result["APAAC" + str(index)] = round(weight * factor / temp * 100, 3)
 
     return result
 
 
-def GetAPseudoAAC(ProteinSequence, lamda: int = 30, weight: float = 0.5):
+def GetAPseudoAAC(
+    ProteinSequence, lamda: int = 30, weight: float = 0.5, cache: bool = False
+):
     """
     Computing all of type II pseudo-amino acid compostion descriptors based on
     the given properties. Note that the number of PAAC strongly depends on the
@@ -451,6 +565,9 @@ def GetAPseudoAAC(ProteinSequence, lamda: int = 30, weight: float = 0.5):
         components with respect to the conventional AA components. The user can
         select any value within the region from 0.05 to 0.7 for the weight
         factor.
+    cache : bool, optional (default: False)
+        keep the results of the last 1024 distinct calls with cache=True in
+        memory, e.g. for featurizing the same sequences repeatedly.
 
     Returns
     -------
@@ -463,12 +580,24 @@ def GetAPseudoAAC(ProteinSequence, lamda: int = 30, weight: float = 0.5):
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = GetAPseudoAAC(protein)
     """
+    if cache:
+        return dict(_GetAPseudoAACCached(ProteinSequence, lamda, weight))
+    # Both parts need the same correlation factors
+    factors = _GetSequenceOrderCorrelationFactorsForAPAAC(ProteinSequence, lamda)
     res: Dict[Any, Any] = {}
-    res.update(GetAPseudoAAC1(ProteinSequence, lamda=lamda, weight=weight))
-    res.update(GetAPseudoAAC2(ProteinSequence, lamda=lamda, weight=weight))
+    res.update(GetAPseudoAAC1(ProteinSequence, lamda, weight, factors))
+    res.update(GetAPseudoAAC2(ProteinSequence, lamda, weight, factors))
     return res
 
 
+@lru_cache(maxsize=1024)
+def _GetAPseudoAACCached(
+    ProteinSequence: str, lamda: int, weight: float
+) -> Tuple[Tuple[str, float], ...]:
+    """Compute GetAPseudoAAC as the items of the dict, so it can be cached."""
+    return tuple(GetAPseudoAAC(ProteinSequence, lamda, weight).items())
+
+
 # Type I descriptors###########################################################
 # Pseudo-Amino Acid Composition descriptors####################################
 # based on different properties################################################
@@ -499,9 +628,10 @@ def GetCorrelationFunction(Ri="S", Rj="D", AAP=None):
     NumAAP = len(AAP)
     theta = 0.0
     for i in range(NumAAP):
-        temp = NormalizeEachAAP(AAP[i])
-        theta = theta + math.pow(temp[Ri] - temp[Rj], 2)
-    result = round(theta / NumAAP, 3)
+        temp = _GetNormalizedAAP(AAP[i])
+        diff = temp[Ri] - temp[Rj]
+        theta = theta + diff * diff
+    result = theta / NumAAP
     return result
 
 
@@ -531,28 +661,71 @@ def GetSequenceOrderCorrelationFactor(ProteinSequence, k: int = 1, AAP=None):
     """
     if AAP is None:
         AAP = []
-    LengthSequence = len(ProteinSequence)
-    res = []
-    for i in range(LengthSequence - k):
-        AA1 = ProteinSequence[i]
-        AA2 = ProteinSequence[i + k]
-        res.append(GetCorrelationFunction(AA1, AA2, AAP))
-    result = round(sum(res) / (LengthSequence - k), 3)
-    return result
+    return _GetCorrelationFactorFromTable(
+        _EncodeSequence(ProteinSequence), k, _GetCorrelationTable(AAP)
+    )
+
 
+@lru_cache(maxsize=None)
+def _GetCorrelationTableFromItems(
+    AAPItems: Tuple[Tuple[Tuple[str, float], ...], ...],
+) -> Tuple[Tuple[float, ...], ...]:
+    """Compute GetCorrelationFunction for all pairs of amino acids."""
+    properties = [_GetNormalizedValues(dict(items)) for items in AAPItems]
+    NumAAP = len(properties)
+    table = []
+    for AA1 in range(20):
+        row = []
+        for AA2 in range(20):
+            theta = 0.0
+            for values in properties:
+                diff = values[AA1] - values[AA2]
+                theta = theta + diff * diff
+            row.append(theta / NumAAP)
+        table.append(tuple(row))
+    return tuple(table)
 
-def GetPseudoAAC1(ProteinSequence, lamda=30, weight=0.05, AAP=None):
+
+def _GetCorrelationTable(AAP: List[Dict[str, float]]) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Get the correlations of the amino acids with the indices i and j for the
+    given properties as table[i][j].
+
+    The table is only computed once per list of properties.
+    """
+    return _GetCorrelationTableFromItems(tuple(tuple(values.items()) for values in AAP))
+
+
+def _GetSequenceOrderCorrelationFactorsForAAP(
+    ProteinSequence: str, lamda: int, AAP: List[Any]
+) -> List[float]:
+    """
+    Compute the sequence order correlation factors for the gaps 1 to lamda
+    based on the given properties.
+
+    The sequence is only encoded once for all gaps.
+    """
+    codes = _EncodeSequence(ProteinSequence)
+    if lamda < 1:
+        # No correlation factors, so the properties do not matter
+        return []
+    return _GetCorrelationFactorsFromTable(codes, lamda, _GetCorrelationTable(AAP))
+
+
+def GetPseudoAAC1(ProteinSequence, lamda=30, weight=0.05, AAP=None, factors=None):
     """
     Computing the first 20 of type I pseudo-amino acid compostion descriptors
     based on the given properties.
+
+    The correlation factors can be passed if they are already computed.
     """
     if AAP is None:
         AAP = []
+    if factors is None:
+        factors = _GetSequenceOrderCorrelationFactorsForAAP(ProteinSequence, lamda, AAP)
     rightpart = 0.0
-    for i in range(lamda):
-        rightpart = rightpart + GetSequenceOrderCorrelationFactor(
-            ProteinSequence, i + 1, AAP
-        )
+    for factor in factors:
+        rightpart = rightpart + factor
     AAC = GetAAComposition(ProteinSequence)
 
     result = {}
@@ -563,28 +736,34 @@ def GetPseudoAAC1(ProteinSequence, lamda=30, weight=0.05, AAP=None):
     return result
 
 
-def GetPseudoAAC2(ProteinSequence, lamda: int = 30, weight: float = 0.05, AAP=None):
+def GetPseudoAAC2(
+    ProteinSequence, lamda: int = 30, weight: float = 0.05, AAP=None, factors=None
+):
     """
     Compute the last lamda of type I pseudo-amino acid compostion descriptors
     based on the given properties.
+
+    The correlation factors can be passed if they are already computed.
     """
     if AAP is None:
         AAP = []
-    rightpart = []
-    for i in range(lamda):
-        rightpart.append(GetSequenceOrderCorrelationFactor(ProteinSequence, i + 1, AAP))
-
+    if factors is None:
+        factors = _GetSequenceOrderCorrelationFactorsForAAP(ProteinSequence, lamda, AAP)
     result = {}
-    temp = 1 + weight * sum(rightpart)
-    for index in range(20, 20 + lamda):
-        result["PAAC" + str(index + 1)] = round(
-            weight * rightpart[index - 20] / temp * 100, 3
-        )
+    temp = 1 + weight * sum(factors)
+    for index, factor in enumerate(factors, start=21):
+        result["PAAC" + str(index)] = round(weight * factor / temp * 100, 3)
 
     return result
 
 
-def GetPseudoAAC(ProteinSequence: str, lamda: int = 30, weight: float = 0.05, AAP=None):
+def GetPseudoAAC(
+    ProteinSequence: str,
+    lamda: int = 30,
+    weight: float = 0.05,
+    AAP=None,
+    cache: bool = False,
+):
     """
     Computing all of type I pseudo-amino acid compostion descriptors based on
     the given properties. Note that the number of PAAC strongly depends on the
@@ -608,6 +787,9 @@ def GetPseudoAAC(ProteinSequence: str, lamda: int = 30, weight: float = 0.05, AA
         value within the region from 0.05 to 0.7 for the weight factor.
     AAP : List[Any]
         contains the properties, each of which is a dict form.
+    cache : bool, optional (default: False)
+        keep the results of the last 1024 distinct calls with cache=True in
+        memory, e.g. for featurizing the same sequences repeatedly.
 
     Returns
     -------
@@ -621,7 +803,116 @@ def GetPseudoAAC(ProteinSequence: str, lamda: int = 30, weight: float = 0.05, AA
     """
     if AAP is None:
         AAP = []
+    if cache:
+        AAPItems = tuple(tuple(values.items()) for values in AAP)
+        return dict(_GetPseudoAACCached(ProteinSequence, lamda, weight, AAPItems))
+    # Both parts need the same correlation factors
+    factors = _GetSequenceOrderCorrelationFactorsForAAP(ProteinSequence, lamda, AAP)
     res: Dict[Any, Any] = {}
-    res.update(GetPseudoAAC1(ProteinSequence, lamda, weight, AAP))
-    res.update(GetPseudoAAC2(ProteinSequence, lamda, weight, AAP))
+    res.update(GetPseudoAAC1(ProteinSequence, lamda, weight, AAP, factors))
+    res.update(GetPseudoAAC2(ProteinSequence, lamda, weight, AAP, factors))
     return res
+
+
+@lru_cache(maxsize=1024)
+def _GetPseudoAACCached(
+    ProteinSequence: str,
+    lamda: int,
+    weight: float,
+    AAPItems: Tuple[Tuple[Tuple[str, float], ...], ...],
+) -> Tuple[Tuple[str, float], ...]:
+    """Compute GetPseudoAAC as the items of the dict, so it can be cached."""
+    AAP = [dict(items) for items in AAPItems]
+    return tuple(GetPseudoAAC(ProteinSequence, lamda, weight, AAP).items())
+
+
+def GetPseudoAACBatch(
+    ProteinSequences: List[str],
+    lamda: Optional[int] = None,
+    weight: float = 0.05,
+    AAP: Optional[List[Any]] = None,
+    n_jobs: Optional[int] = 1,
+    chunksize: int = 64,
+) -> List[Dict[Any, Any]]:
+    """
+    Computing the type I pseudo-amino acid compostion descriptors for many
+    protein sequences.
+
+    Parameters
+    ----------
+    ProteinSequences : List[str]
+        pure protein sequences
+    lamda : int, optional (default: None)
+        reflects the rank of correlation, see GetPseudoAAC. If it is None,
+        the default of the descriptor function is used: 10 without AAP (see
+        _GetPseudoAAC) and 30 with AAP (see GetPseudoAAC).
+    weight : float, optional (default: 0.05)
+        weight factor of the additional PseAA components, see GetPseudoAAC
+    AAP : List[Any], optional (default: None)
+        contains the properties, each of which is a dict form. If it is None,
+        hydrophobicity, hydrophilicity and residue mass are used.
+    n_jobs : int, optional (default: 1)
+        number of worker processes. None uses all CPUs.
+    chunksize : int, optional (default: 64)
+        number of sequences which are sent to a worker process at once.
+
+    Returns
+    -------
+    result : List[Dict[Any, Any]]
+        contains the 20+lamda PAAC descriptors for each sequence, in the input
+        order.
+
+    Examples
+    --------
+    >>> result = GetPseudoAACBatch(["ADGCGVGEGTGQGPMCNCMC", "MENATLLKSTTRHIRIFAAE"])
+    """
+    # Leave out lamda if it is None, so that the default of each function is used
+    kwargs: Dict[str, Any] = {"weight": weight}
+    if lamda is not None:
+        kwargs["lamda"] = lamda
+    if AAP is not None:
+        kwargs["AAP"] = AAP
+    function = cast(
+        Callable[[str], Dict[Any, Any]],
+        partial(_GetPseudoAAC if AAP is None else GetPseudoAAC, **kwargs),
+    )
+    return _MapSequences(function, ProteinSequences, n_jobs, chunksize)
+
+
+def GetAPseudoAACBatch(
+    ProteinSequences: List[str],
+    lamda: int = 30,
+    weight: float = 0.5,
+    n_jobs: Optional[int] = 1,
+    chunksize: int = 64,
+) -> List[Dict[Any, Any]]:
+    """
+    Computing the type II pseudo-amino acid compostion descriptors for many
+    protein sequences.
+
+    Parameters
+    ----------
+    ProteinSequences : List[str]
+        pure protein sequences
+    lamda : int, optional (default: 30)
+        reflects the rank of correlation, see GetAPseudoAAC
+    weight : float, optional (default: 0.5)
+        weight factor of the additional PseAA components, see GetAPseudoAAC
+    n_jobs : int, optional (default: 1)
+        number of worker processes. None uses all CPUs.
+    chunksize : int, optional (default: 64)
+        number of sequences which are sent to a worker process at once.
+
+    Returns
+    -------
+    result : List[Dict[Any, Any]]
+        contains the 20+2*lamda APAAC descriptors for each sequence, in the
+        input order.
+
+    Examples
+    --------
+    >>> proteins = ["ADGCGVGEGTGQGPMCNCMC", "MENATLLKSTTRHIRIFAAE"]
+    >>> result = GetAPseudoAACBatch(proteins, lamda=5)
+    """
+    function = partial(GetAPseudoAAC, lamda=lamda, weight=weight)
+    return _MapSequences(function, ProteinSequences, n_jobs, chunksize)
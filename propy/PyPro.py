@@ -19,9 +19,12 @@
 """Computing different types of protein descriptors."""
 
 # Core Library
-from typing import Any, Dict, List, Optional
+import inspect
+from functools import partial, wraps
+from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
 
 # Local
+from . import _MapSequences
 from .AAComposition import (
     CalculateAAComposition,
     CalculateDipeptideComposition,
@@ -38,7 +41,7 @@ from .Autocorrelation import (
 )
 from .CTD import CalculateCTD
 from .GetSubSeq import GetSubSequence
-from .PseudoAAC import GetAPseudoAAC, GetPseudoAAC, _GetPseudoAAC
+from .PseudoAAC import GetAPseudoAAC, GetPseudoAAC, _EncodeSequence, _GetPseudoAAC
 from .QuasiSequenceOrder import (
     GetQuasiSequenceOrder,
     GetQuasiSequenceOrderp,
@@ -46,6 +49,33 @@ from .QuasiSequenceOrder import (
     GetSequenceOrderCouplingNumberTotal,
 )
 
+_Method = TypeVar("_Method", bound=Callable[..., Dict[Any, Any]])
+
+
+def _Memoize(method: _Method) -> _Method:
+    """
+    Cache the descriptors computed by a method of GetProDes per instance.
+
+    The cache is keyed by the method name and the effective parameters, so
+    e.g. ``GetPAAC()`` and ``GetPAAC(lamda=10)`` share an entry. A copy of the
+    cached descriptors is returned, so callers may modify the result.
+    """
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        parameters = tuple(
+            (name, value) for name, value in bound.arguments.items() if name != "self"
+        )
+        key = (method.__name__, parameters)
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return dict(self._cache[key])
+
+    return cast(_Method, wrapper)
+
 
 class GetProDes:
     """Collect all descriptor calcualtion modules."""
@@ -54,16 +84,19 @@ class GetProDes:
 
     Version = 1.0
 
-    def __init__(self, ProteinSequence: str = "") -> None:
+    __slots__ = ("ProteinSequence", "_cache")
+
+    def __init__(self, ProteinSequence: str) -> None:
         """Input a protein sequence."""
         if len(ProteinSequence) == 0:
-            print(
+            raise ValueError(
                 "You must input a protein sequence "
                 "when constructing a object. It is a string!"
             )
-        else:
-            self.ProteinSequence = ProteinSequence
+        self.ProteinSequence = ProteinSequence
+        self._cache: Dict[Any, Dict[Any, Any]] = {}
 
+    @_Memoize
     def GetAAComp(self) -> Dict[str, float]:
         """
         Amino acid compositon descriptors (20).
@@ -77,6 +110,7 @@ class GetProDes:
         res = CalculateAAComposition(self.ProteinSequence)
         return res
 
+    @_Memoize
     def GetDPComp(self) -> Dict[str, float]:
         """
         Dipeptide composition descriptors (400).
@@ -90,6 +124,7 @@ class GetProDes:
         res = CalculateDipeptideComposition(self.ProteinSequence)
         return res
 
+    @_Memoize
     def GetTPComp(self) -> Dict[str, int]:
         """
         Tri-peptide composition descriptors (8000).
@@ -103,6 +138,7 @@ class GetProDes:
         res = GetSpectrumDict(self.ProteinSequence)
         return res
 
+    @_Memoize
     def GetMoreauBrotoAuto(self) -> Dict[Any, Any]:
         """
         Normalized Moreau-Broto autocorrelation descriptors (240).
@@ -116,6 +152,7 @@ class GetProDes:
         res = CalculateNormalizedMoreauBrotoAutoTotal(self.ProteinSequence)
         return res
 
+    @_Memoize
     def GetMoranAuto(self) -> Dict[Any, Any]:
         """
         Moran autocorrelation descriptors (240).
@@ -129,6 +166,7 @@ class GetProDes:
         res = CalculateMoranAutoTotal(self.ProteinSequence)
         return res
 
+    @_Memoize
     def GetGearyAuto(self) -> Dict[Any, Any]:
         """
         Geary autocorrelation descriptors (240).
@@ -142,6 +180,7 @@ class GetProDes:
         res = CalculateGearyAutoTotal(self.ProteinSequence)
         return res
 
+    @_Memoize
     def GetCTD(self) -> Dict[Any, Any]:
         """
         Composition Transition Distribution descriptors (147).
@@ -155,6 +194,7 @@ class GetProDes:
         res = CalculateCTD(self.ProteinSequence)
         return res
 
+    @_Memoize
     def GetPAAC(self, lamda: int = 10, weight: float = 0.05) -> Dict[Any, Any]:
         """
         Type I Pseudo amino acid composition descriptors (default is 30).
@@ -217,6 +257,7 @@ class GetProDes:
         res = GetPseudoAAC(self.ProteinSequence, lamda=lamda, weight=weight, AAP=AAP)
         return res
 
+    @_Memoize
     def GetAPAAC(self, lamda: int = 10, weight: float = 0.5) -> Dict[Any, Any]:
         """
         Amphiphilic (Type II) Pseudo amino acid composition descriptors.
@@ -246,6 +287,7 @@ class GetProDes:
         res = GetAPseudoAAC(self.ProteinSequence, lamda=lamda, weight=weight)
         return res
 
+    @_Memoize
     def GetSOCN(self, maxlag: int = 45) -> Dict[Any, Any]:
         """
         Sequence order coupling numbers  default is 45.
@@ -291,6 +333,7 @@ class GetProDes:
         )
         return res
 
+    @_Memoize
     def GetQSO(self, maxlag: int = 30, weight: float = 0.1) -> Dict[Any, Any]:
         """
         Quasi sequence order descriptors  default is 50.
@@ -428,6 +471,7 @@ class GetProDes:
         socn_maxlag: int = 45,
         qso_maxlag: int = 30,
         qso_weight: float = 0.1,
+        n_jobs: Optional[int] = 1,
     ) -> Dict[Any, Any]:
         """
         Calcualte all descriptors except tri-peptide descriptors.
@@ -461,20 +505,50 @@ class GetProDes:
             than maxlag.
         qso_weight : float, optional (default: 0.1)
             Used by GetQSO()
-        """
-
+        n_jobs : int, optional (default: 1)
+            number of worker processes which compute the descriptor groups
+            concurrently. None uses all CPUs.
+
+        Raises
+        ------
+        ValueError
+            if the sequence contains characters which are not in AALetter or
+            if it is not longer than paac_lamda and apaac_lamda.
+        """
+        # Fail before any descriptor is computed, not deep inside one of them
+        _EncodeSequence(self.ProteinSequence)
+        if len(self.ProteinSequence) <= max(paac_lamda, apaac_lamda):
+            raise ValueError(
+                f"The protein sequence of length {len(self.ProteinSequence)} must "
+                f"be longer than paac_lamda={paac_lamda} and "
+                f"apaac_lamda={apaac_lamda}"
+            )
+        functions: List[Callable[[], Dict[Any, Any]]] = [
+            self.GetAAComp,
+            self.GetDPComp,
+            # self.GetTPComp,
+            self.GetMoreauBrotoAuto,
+            self.GetMoranAuto,
+            self.GetGearyAuto,
+            self.GetCTD,
+            partial(self.GetPAAC, lamda=paac_lamda, weight=paac_weight),
+            partial(self.GetAPAAC, lamda=apaac_lamda, weight=apaac_weight),
+            partial(self.GetSOCN, maxlag=socn_maxlag),
+            partial(self.GetQSO, maxlag=qso_maxlag, weight=qso_weight),
+        ]
         res: Dict[Any, Any] = {}
-        res.update(self.GetAAComp())
-        res.update(self.GetDPComp())
-        # res.update(self.GetTPComp())
-        res.update(self.GetMoreauBrotoAuto())
-        res.update(self.GetMoranAuto())
-        res.update(self.GetGearyAuto())
-        res.update(self.GetCTD())
-        res.update(self.GetPAAC(lamda=paac_lamda, weight=paac_weight))
-        res.update(self.GetAPAAC(lamda=apaac_lamda, weight=apaac_weight))
-        res.update(self.GetSOCN(maxlag=socn_maxlag))
-        res.update(self.GetQSO(maxlag=qso_maxlag, weight=qso_weight))
+        if n_jobs == 1:
+            for function in functions:
+                res.update(function())
+            return res
+        # Core Library
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(function) for function in functions]
+            # Merge in the order of the functions to keep the order of the keys
+            for future in futures:
+                res.update(future.result())
         return res
 
     def GetAAindex1(self, name: str, path: Optional[str] = ".") -> Dict[str, float]:
@@ -517,3 +591,44 @@ class GetProDes:
         >>> result = GetProDes(protein).GetAAindex23(name="KRIW790103")
         """
         return GetAAIndex23(name, path=path)
+
+
+def _GetALL(ProteinSequence: str, **kwargs: Any) -> Dict[Any, Any]:
+    """Compute GetProDes(ProteinSequence).GetALL(**kwargs)."""
+    return GetProDes(ProteinSequence).GetALL(**kwargs)
+
+
+def GetALLBatch(
+    ProteinSequences: List[str],
+    n_jobs: Optional[int] = 1,
+    chunksize: int = 16,
+    **kwargs: Any,
+) -> List[Dict[Any, Any]]:
+    """
+    Calculate all descriptors except tri-peptide descriptors for many protein
+    sequences.
+
+    Parameters
+    ----------
+    ProteinSequences : List[str]
+        pure protein sequences
+    n_jobs : int, optional (default: 1)
+        number of worker processes. None uses all CPUs.
+    chunksize : int, optional (default: 16)
+        number of sequences which are sent to a worker process at once.
+    kwargs :
+        the parameters of GetProDes.GetALL, e.g. paac_lamda
+
+    Returns
+    -------
+    result : List[Dict[Any, Any]]
+        contains all descriptors for each sequence, in the input order.
+
+    Examples
+    --------
+    >>> from propy.GetProteinFromUniprot import GetProteinSequence
+    >>> proteins = [GetProteinSequence(ProteinID="Q9NQ39")]
+    >>> result = GetALLBatch(proteins, paac_lamda=5)
+    """
+    function: Callable[[str], Dict[Any, Any]] = partial(_GetALL, **kwargs)
+    return _MapSequences(function, ProteinSequences, n_jobs, chunksize)
@@ -39,28 +39,20 @@ References
 """
 
 # Core Library
-import json
-import math
-from typing import Any, Dict
-
-# Third party
-from pkg_resources import resource_filename
+from operator import add, mul
+from typing import Any, Dict, List, Optional
 
 # First party
-from propy import AALetter
+from propy import AALetter, _LoadData
 
 # Distance is the Schneider-Wrede physicochemical distance matrix
 # used by Chou et. al.
-filepath = resource_filename(
-    __name__, "data/schneider-wrede-physicochemical-distance-matrix.json"
+_Distance1: Dict[str, float] = _LoadData(
+    "schneider-wrede-physicochemical-distance-matrix.json"
 )
-with open(filepath, "r") as f:
-    _Distance1: Dict[str, float] = json.load(f)
 
 # Distance is the Grantham chemical distance matrix used by Grantham et. al.
-filepath = resource_filename(__name__, "data/grantham-chemical-distance-matrix.json")
-with open(filepath, "r") as f:
-    _Distance2: Dict[str, int] = json.load(f)
+_Distance2: Dict[str, int] = _LoadData("grantham-chemical-distance-matrix.json")
 
 
 def GetSequenceOrderCouplingNumber(
@@ -87,15 +79,24 @@ def GetSequenceOrderCouplingNumber(
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = GetSequenceOrderCouplingNumber(protein)
     """
-    NumProtein = len(ProteinSequence)
-    tau = 0.0
-    for i in range(NumProtein - d):
-        temp1 = ProteinSequence[i]
-        temp2 = ProteinSequence[i + d]
-        tau = tau + math.pow(distancematrix[temp1 + temp2], 2)
+    # Look up the distances of all residue pairs d apart in one pass
+    distances = list(
+        map(distancematrix.__getitem__, map(add, ProteinSequence, ProteinSequence[d:]))
+    )
+    tau = sum(map(mul, distances, distances), 0.0)
     return round(tau, 3)
 
 
+def _GetSequenceOrderCouplingNumbers(
+    ProteinSequence: str, maxlag: int, distancematrix: Dict[Any, Any]
+) -> List[float]:
+    """Compute the sequence order coupling numbers for the gaps 1 to maxlag."""
+    return [
+        GetSequenceOrderCouplingNumber(ProteinSequence, d, distancematrix)
+        for d in range(1, maxlag + 1)
+    ]
+
+
 def GetSequenceOrderCouplingNumberp(
     ProteinSequence: str, maxlag: int = 30, distancematrix: Dict[Any, Any] = None
 ):
@@ -269,7 +270,11 @@ def GetAAComposition(ProteinSequence: str) -> Dict[str, float]:
 
 
 def GetQuasiSequenceOrder1(
-    ProteinSequence: str, maxlag: int = 30, weight: float = 0.1, distancematrix=None
+    ProteinSequence: str,
+    maxlag: int = 30,
+    weight: float = 0.1,
+    distancematrix=None,
+    taus: Optional[List[float]] = None,
 ):
     """
     Compute the first 20 quasi-sequence-order descriptors for a given protein
@@ -289,14 +294,13 @@ def GetQuasiSequenceOrder1(
     >>> result = GetQuasiSequenceOrder1(protein)
 
     see :py:func:`GetQuasiSequenceOrder` for the choice of parameters.
+    The coupling numbers can be passed as taus if they are already computed.
     """
     if distancematrix is None:
         distancematrix = {}
-    rightpart = 0.0
-    for i in range(maxlag):
-        rightpart = rightpart + GetSequenceOrderCouplingNumber(
-            ProteinSequence, i + 1, distancematrix
-        )
+    if taus is None:
+        taus = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, distancematrix)
+    rightpart = sum(taus)
     AAC = GetAAComposition(ProteinSequence)
     result: Dict[str, float] = {}
     temp = 1 + weight * rightpart
@@ -307,7 +311,11 @@ def GetQuasiSequenceOrder1(
 
 
 def GetQuasiSequenceOrder2(
-    ProteinSequence: str, maxlag=30, weight=0.1, distancematrix=None
+    ProteinSequence: str,
+    maxlag=30,
+    weight=0.1,
+    distancematrix=None,
+    taus: Optional[List[float]] = None,
 ):
     """
     Compute the last maxlag quasi-sequence-order descriptors for a given
@@ -327,23 +335,25 @@ def GetQuasiSequenceOrder2(
     >>> result = GetQuasiSequenceOrder2(protein)
 
     see :py:func:`GetQuasiSequenceOrder` for the choice of parameters.
+    The coupling numbers can be passed as taus if they are already computed.
     """
     if distancematrix is None:
         distancematrix = {}
-    rightpart = []
-    for i in range(maxlag):
-        rightpart.append(
-            GetSequenceOrderCouplingNumber(ProteinSequence, i + 1, distancematrix)
-        )
+    if taus is None:
+        taus = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, distancematrix)
     result = {}
-    temp = 1 + weight * sum(rightpart)
+    temp = 1 + weight * sum(taus)
     for index in range(20, 20 + maxlag):
-        result["QSO" + str(index + 1)] = round(weight * rightpart[index - 20] / temp, 6)
+        result["QSO" + str(index + 1)] = round(weight * taus[index - 20] / temp, 6)
     return result
 
 
 def GetQuasiSequenceOrder1SW(
-    ProteinSequence: str, maxlag=30, weight=0.1, distancematrix=_Distance1
+    ProteinSequence: str,
+    maxlag=30,
+    weight=0.1,
+    distancematrix=_Distance1,
+    taus: Optional[List[float]] = None,
 ):
     """
     Compute the first 20 quasi-sequence-order descriptors for a given protein
@@ -363,12 +373,11 @@ def GetQuasiSequenceOrder1SW(
     >>> result = GetQuasiSequenceOrder1SW(protein)
 
     see :py:func:`GetQuasiSequenceOrder` for the choice of parameters.
+    The coupling numbers can be passed as taus if they are already computed.
     """
-    rightpart = 0.0
-    for i in range(maxlag):
-        rightpart = rightpart + GetSequenceOrderCouplingNumber(
-            ProteinSequence, i + 1, distancematrix
-        )
+    if taus is None:
+        taus = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, distancematrix)
+    rightpart = sum(taus)
     AAC = GetAAComposition(ProteinSequence)
     result = {}
     temp = 1 + weight * rightpart
@@ -379,7 +388,11 @@ def GetQuasiSequenceOrder1SW(
 
 
 def GetQuasiSequenceOrder2SW(
-    ProteinSequence: str, maxlag=30, weight=0.1, distancematrix=_Distance1
+    ProteinSequence: str,
+    maxlag=30,
+    weight=0.1,
+    distancematrix=_Distance1,
+    taus: Optional[List[float]] = None,
 ):
     """
     Compute the last maxlag quasi-sequence-order descriptors for a given
@@ -399,18 +412,14 @@ def GetQuasiSequenceOrder2SW(
     >>> result = GetQuasiSequenceOrder2SW(protein)
 
     see :py:func:`GetQuasiSequenceOrder` for the choice of parameters.
+    The coupling numbers can be passed as taus if they are already computed.
     """
-    rightpart = []
-    for i in range(maxlag):
-        rightpart.append(
-            GetSequenceOrderCouplingNumber(ProteinSequence, i + 1, distancematrix)
-        )
+    if taus is None:
+        taus = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, distancematrix)
     result = {}
-    temp = 1 + weight * sum(rightpart)
+    temp = 1 + weight * sum(taus)
     for index in range(20, 20 + maxlag):
-        result["QSOSW" + str(index + 1)] = round(
-            weight * rightpart[index - 20] / temp, 6
-        )
+        result["QSOSW" + str(index + 1)] = round(weight * taus[index - 20] / temp, 6)
 
     return result
 
@@ -420,6 +429,7 @@ def GetQuasiSequenceOrder1Grant(
     maxlag: int = 30,
     weight: float = 0.1,
     distancematrix=_Distance2,
+    taus: Optional[List[float]] = None,
 ):
     """
     Compute the first 20 quasi-sequence-order descriptors for a given protein
@@ -439,12 +449,11 @@ def GetQuasiSequenceOrder1Grant(
     >>> result = GetQuasiSequenceOrder1Grant(protein)
 
     see :py:func:`GetQuasiSequenceOrder` for the choice of parameters.
+    The coupling numbers can be passed as taus if they are already computed.
     """
-    rightpart = 0.0
-    for i in range(maxlag):
-        rightpart = rightpart + GetSequenceOrderCouplingNumber(
-            ProteinSequence, i + 1, distancematrix
-        )
+    if taus is None:
+        taus = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, distancematrix)
+    rightpart = sum(taus)
     AAC = GetAAComposition(ProteinSequence)
     result = {}
     temp = 1 + weight * rightpart
@@ -459,6 +468,7 @@ def GetQuasiSequenceOrder2Grant(
     maxlag: int = 30,
     weight: float = 0.1,
     distancematrix=_Distance2,
+    taus: Optional[List[float]] = None,
 ):
     """
     Compute the last maxlag quasi-sequence-order descriptors for a given
@@ -478,18 +488,14 @@ def GetQuasiSequenceOrder2Grant(
     >>> result = GetQuasiSequenceOrder2Grant(protein)
 
     see :py:func:`GetQuasiSequenceOrder` for the choice of parameters.
+    The coupling numbers can be passed as taus if they are already computed.
     """
-    rightpart = []
-    for i in range(maxlag):
-        rightpart.append(
-            GetSequenceOrderCouplingNumber(ProteinSequence, i + 1, distancematrix)
-        )
+    if taus is None:
+        taus = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, distancematrix)
     result = {}
-    temp = 1 + weight * sum(rightpart)
+    temp = 1 + weight * sum(taus)
     for index in range(20, 20 + maxlag):
-        result["QSOgrant" + str(index + 1)] = round(
-            weight * rightpart[index - 20] / temp, 6
-        )
+        result["QSOgrant" + str(index + 1)] = round(weight * taus[index - 20] / temp, 6)
 
     return result
 
@@ -523,14 +529,21 @@ def GetQuasiSequenceOrder(
     >>> protein = GetProteinSequence(ProteinID="Q9NQ39")
     >>> result = GetQuasiSequenceOrder(protein)
     """
+    # Both parts of each distance matrix need the same coupling numbers
+    taus1 = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, _Distance1)
+    taus2 = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, _Distance2)
     result: Dict[Any, Any] = {}
-    result.update(GetQuasiSequenceOrder1SW(ProteinSequence, maxlag, weight, _Distance1))
-    result.update(GetQuasiSequenceOrder2SW(ProteinSequence, maxlag, weight, _Distance1))
     result.update(
-        GetQuasiSequenceOrder1Grant(ProteinSequence, maxlag, weight, _Distance2)
+        GetQuasiSequenceOrder1SW(ProteinSequence, maxlag, weight, _Distance1, taus1)
+    )
+    result.update(
+        GetQuasiSequenceOrder2SW(ProteinSequence, maxlag, weight, _Distance1, taus1)
+    )
+    result.update(
+        GetQuasiSequenceOrder1Grant(ProteinSequence, maxlag, weight, _Distance2, taus2)
     )
     result.update(
-        GetQuasiSequenceOrder2Grant(ProteinSequence, maxlag, weight, _Distance2)
+        GetQuasiSequenceOrder2Grant(ProteinSequence, maxlag, weight, _Distance2, taus2)
     )
     return result
 
@@ -571,11 +584,12 @@ def GetQuasiSequenceOrderp(
     """
     if distancematrix is None:
         distancematrix = {}
+    taus = _GetSequenceOrderCouplingNumbers(ProteinSequence, maxlag, distancematrix)
     result: Dict[Any, Any] = {}
     result.update(
-        GetQuasiSequenceOrder1(ProteinSequence, maxlag, weight, distancematrix)
+        GetQuasiSequenceOrder1(ProteinSequence, maxlag, weight, distancematrix, taus)
     )
     result.update(
-        GetQuasiSequenceOrder2(ProteinSequence, maxlag, weight, distancematrix)
+        GetQuasiSequenceOrder2(ProteinSequence, maxlag, weight, distancematrix, taus)
     )
     return result
@@ -16,9 +16,11 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor,
 # Boston, MA  02110-1301, USA.
 # Core Library
+import json
+import os
 import sys
 import warnings
-from typing import List
+from typing import Any, Callable, FrozenSet, List, Optional, TypeVar
 
 _python_version = sys.version_info
 
@@ -33,5 +35,40 @@ if _python_version.major == 3 and _python_version.minor < 8:
 
 AALetter: List[str] = list("ARNDCEQGHILKMFPSTWYV")
 
+# For membership tests, AALetter defines the order of the descriptors
+AASet: FrozenSet[str] = frozenset(AALetter)
+
 ProteinSequence_docstring = """ProteinSequence: str
         a pure protein sequence"""
+
+
+def _LoadData(filename: str) -> Any:
+    """Load a JSON file from the data directory of propy."""
+    # Located relative to __file__, as importing pkg_resources is slow
+    with open(os.path.join(os.path.dirname(__file__), "data", filename), "r") as f:
+        return json.load(f)
+
+
+_T = TypeVar("_T")
+
+
+def _MapSequences(
+    function: Callable[[str], _T],
+    ProteinSequences: List[str],
+    n_jobs: Optional[int],
+    chunksize: int,
+) -> List[_T]:
+    """
+    Apply function to each protein sequence, keeping the input order.
+
+    The descriptors are computed in pure Python, so for n_jobs != 1 the
+    sequences are distributed over a process pool instead of threads, sending
+    chunksize sequences to a worker process at once. None uses all CPUs.
+    """
+    if n_jobs == 1:
+        return [function(sequence) for sequence in ProteinSequences]
+    # Core Library
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(function, ProteinSequences, chunksize=chunksize))
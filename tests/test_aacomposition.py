@@ -36,3 +36,19 @@ def test_main():
     print(spectrum)
     res = CalculateAADipeptideComposition(protein)
     print(len(res))
+
+
+def test_dipeptide_homodipeptide():
+    result = CalculateDipeptideComposition("AAAAG")
+    assert result["AA"] == 50.0
+    assert result["AG"] == 25.0
+    assert sum(result.values()) == 75.0
+
+
+def test_spectrum_overlapping():
+    result = GetSpectrumDict("AAAAGAGA")
+    assert len(result) == 8000
+    assert result["AAA"] == 1
+    assert result["AGA"] == 1
+    assert result["GAG"] == 1
+    assert result["AAG"] == 1
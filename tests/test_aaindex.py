@@ -16,10 +16,14 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor,
 # Boston, MA  02110-1301, USA.
+# Core Library
+import os
+
 # Third party
 import pytest
 
 # First party
+from propy import AAIndex
 from propy.AAIndex import GetAAIndex1, GetAAIndex23
 
 
@@ -37,3 +41,12 @@ def test_main():
     print(len(temp2))
     temp2 = GetAAIndex23("GRAR740104")
     print(len(temp2))
+
+
+def test_parse_once():
+    path = os.path.join(os.path.dirname(AAIndex.__file__), "aaindex")
+    expected = GetAAIndex1("KRIW790103", path=path)
+    assert os.path.join(path, "aaindex1") in AAIndex._parsed
+    parsed = set(AAIndex._parsed)
+    assert GetAAIndex1("KRIW790103", path=path) == expected
+    assert AAIndex._parsed == parsed
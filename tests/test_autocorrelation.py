@@ -16,11 +16,15 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor,
 # Boston, MA  02110-1301, USA.
+# Third party
+import pytest
+
 # First party
 from propy.Autocorrelation import (
     CalculateAutoTotal,
     CalculateMoranAutoMutability,
     CalculateNormalizedMoreauBrotoAuto,
+    NormalizeEachAAP,
     _AAProperty,
     _AAPropertyName,
 )
@@ -35,3 +39,8 @@ def test_main():
     temp2 = CalculateMoranAutoMutability(protein)
     print(temp2)
     print(len(CalculateAutoTotal(protein)))
+
+
+def test_normalize_invalid():
+    with pytest.raises(ValueError):
+        NormalizeEachAAP({"A": 1.0, "R": 2.0})
@@ -17,7 +17,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor,
 # Boston, MA  02110-1301, USA.
 # First party
-from propy.CTD import CalculateCTD
+from propy.CTD import CalculateCTD, CalculateCTDBatch
 
 
 def test_main():
@@ -40,3 +40,12 @@ def test_main():
     # print len(CalculateT(protein))
     # print len(CalculateD(protein))
     print(CalculateCTD(protein))
+
+
+def test_batch():
+    proteins = [
+        "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS",
+        "MENATLLKSTTRHIRIFAAEIDRDGELVPSNQVLTLDIDPDNEFNWNEDALQKIYRKFDELV",
+    ]
+    expected = [CalculateCTD(protein) for protein in proteins]
+    assert CalculateCTDBatch(proteins) == expected
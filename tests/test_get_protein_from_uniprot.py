@@ -17,13 +17,28 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor,
 # Boston, MA  02110-1301, USA.
 # Core Library
+import io
 import os
 from tempfile import mkstemp
 
+# Third party
+import pytest
+
 # First party
+from propy import GetProteinFromUniprot
 from propy.GetProteinFromUniprot import GetProteinSequence, GetProteinSequenceFromTxt
 
 
+class _Response:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.reason = ""
+        self.headers = headers or {}
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
 def test_main():
     _, result_filepath = mkstemp(suffix="result.txt", prefix="propy3")
     _, target_filepath = mkstemp(suffix="target.txt", prefix="propy3")
@@ -49,3 +64,102 @@ def test_main():
     # Cleanup
     os.remove(result_filepath)
     os.remove(target_filepath)
+
+
+def test_download_redirect(monkeypatch):
+    responses = {
+        "/uniprotkb/OLD.fasta": (
+            _Response(303, {"Location": "/uniprotkb/NEW.fasta"}),
+            b"",
+        ),
+        "/uniprotkb/NEW.fasta": (_Response(200), b">sp|NEW\nACDE\n"),
+    }
+    monkeypatch.setattr(GetProteinFromUniprot, "getproxies", lambda: {})
+    monkeypatch.setattr(GetProteinFromUniprot, "_Request", responses.__getitem__)
+    data = GetProteinFromUniprot._Download("/uniprotkb/OLD.fasta")
+    assert data == b">sp|NEW\nACDE\n"
+
+
+def test_download_proxy(monkeypatch):
+    urls = []
+
+    def urlopen(url, timeout):
+        urls.append(url)
+        return io.BytesIO(b">sp|P\nACDE\n")
+
+    monkeypatch.setattr(
+        GetProteinFromUniprot, "getproxies", lambda: {"https": "http://proxy:3128"}
+    )
+    monkeypatch.setattr(GetProteinFromUniprot, "urlopen", urlopen)
+    assert GetProteinFromUniprot._Download("/uniprotkb/P.fasta") == b">sp|P\nACDE\n"
+    assert urls == ["https://rest.uniprot.org/uniprotkb/P.fasta"]
+
+
+def test_download_retry(monkeypatch):
+    responses = [
+        (_Response(429, {"Retry-After": "3"}), b""),
+        (_Response(503), b""),
+        (_Response(200), b">sp|P\nACDE\n"),
+    ]
+    delays = []
+    monkeypatch.setattr(GetProteinFromUniprot, "getproxies", lambda: {})
+    monkeypatch.setattr(
+        GetProteinFromUniprot, "_Request", lambda path: responses.pop(0)
+    )
+    monkeypatch.setattr(GetProteinFromUniprot.time, "sleep", delays.append)
+    assert GetProteinFromUniprot._Download("/uniprotkb/P.fasta") == b">sp|P\nACDE\n"
+    assert delays == [3.0, 2.0]
+
+
+def test_invalid_protein_id(monkeypatch):
+    def _Download(path):
+        raise AssertionError("must not download")
+
+    monkeypatch.setattr(GetProteinFromUniprot, "_Download", _Download)
+    for ProteinID in ["../P48039", "P48039/..", "", "p48039"]:
+        with pytest.raises(ValueError):
+            GetProteinFromUniprot._DownloadFasta(ProteinID)
+
+
+def test_disable_cache(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PROPY_CACHE", "")
+    monkeypatch.setattr(
+        GetProteinFromUniprot, "_Download", lambda path: b">sp|P48039\nACDE\n"
+    )
+    assert GetProteinFromUniprot._DownloadFasta("P48039-2") == b">sp|P48039\nACDE\n"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_connections_closed(monkeypatch, tmp_path):
+    class _Connection:
+        def __init__(self, host, timeout):
+            self.closed = False
+            connections.append(self)
+
+        def request(self, method, path):
+            self.path = path
+
+        def getresponse(self):
+            response = _Response(200)
+            response.read = lambda: b">sp|" + self.path.encode() + b"\nACDE\n"
+            return response
+
+        def close(self):
+            self.closed = True
+
+    connections = []
+    monkeypatch.setenv("PROPY_CACHE", "")
+    monkeypatch.setattr(GetProteinFromUniprot, "getproxies", lambda: {})
+    monkeypatch.setattr(
+        GetProteinFromUniprot.http.client, "HTTPSConnection", _Connection
+    )
+    GetProteinSequence.cache_clear()
+    (tmp_path / "ids.txt").write_text("P00001\nP00002\nP00003\nP00004\n")
+    GetProteinSequenceFromTxt(str(tmp_path), "ids.txt", "sequences.txt", n_jobs=2)
+    GetProteinSequence.cache_clear()
+    assert (tmp_path / "sequences.txt").read_text() == "ACDE\n" * 4
+    assert 1 <= len(connections) <= 2
+    assert all(connection.closed for connection in connections)
+    GetProteinFromUniprot._Request("/uniprotkb/P00005.fasta")
+    assert connections[-1].closed
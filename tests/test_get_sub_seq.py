@@ -17,7 +17,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor,
 # Boston, MA  02110-1301, USA.
 # First party
-from propy.GetSubSeq import GetSubSequence
+from propy.GetSubSeq import GetSubSequence, IterSubSequence
 
 
 def test_main():
@@ -26,3 +26,16 @@ def test_main():
     print(subseq)
     print(len(subseq))
     # print(len(subseq[0]))
+
+
+def test_bytes():
+    protein = "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS"
+    subseq = GetSubSequence(protein, ToAA="D", window=3)
+    subseq_bytes = GetSubSequence(protein.encode("ascii"), ToAA="D", window=3)
+    assert subseq_bytes == [seq.encode("ascii") for seq in subseq]
+
+
+def test_iter():
+    protein = "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS"
+    subseq = GetSubSequence(protein, ToAA="S", window=2)
+    assert list(IterSubSequence(protein, ToAA="S", window=2)) == subseq
@@ -20,7 +20,7 @@
 import pytest
 
 # First party
-from propy import PyPro
+from propy import PyPro, _MapSequences
 from propy.GetProteinFromUniprot import GetProteinSequence as gps
 
 
@@ -62,3 +62,9 @@ def test_p48039():
 
     for i in paac:
         print(i)
+
+
+def test_map_sequences():
+    sequences = ["ADGCGVGEG", "MENA", "TLLKSTTRHIR"]
+    assert _MapSequences(len, sequences, n_jobs=1, chunksize=1) == [9, 4, 11]
+    assert _MapSequences(len, sequences, n_jobs=2, chunksize=1) == [9, 4, 11]
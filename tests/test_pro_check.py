@@ -23,3 +23,8 @@ from propy.ProCheck import ProteinCheck
 def test_main():
     protein = "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDASU"
     print(ProteinCheck(protein))
+
+
+def test_bytes():
+    assert ProteinCheck(b"ADGCGVGEGT") == ProteinCheck("ADGCGVGEGT") == 10
+    assert ProteinCheck(b"ADGCGVGEGU") == 0
@@ -16,8 +16,20 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor,
 # Boston, MA  02110-1301, USA.
+# Third party
+import pytest
+
 # First party
-from propy.PseudoAAC import GetPseudoAAC, _hydrophilicity, _Hydrophobicity
+from propy.PseudoAAC import (
+    GetAPseudoAAC,
+    GetAPseudoAACBatch,
+    GetPseudoAAC,
+    GetPseudoAACBatch,
+    NormalizeEachAAP,
+    _GetPseudoAAC,
+    _hydrophilicity,
+    _Hydrophobicity,
+)
 
 
 def test_main():
@@ -59,3 +71,82 @@ AELQNREKAREQRNWALADEIRGRLKRAGIEVTDTADGPQWSLLGGDTK"
 
     for i in PAAC:
         print(i, PAAC[i])
+
+
+def test_normalize_invalid():
+    with pytest.raises(ValueError):
+        NormalizeEachAAP({"A": 1.0, "R": 2.0})
+
+
+def test_batch():
+    proteins = [
+        "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS",
+        "MENATLLKSTTRHIRIFAAEIDRDGELVPSNQVLTLDIDPDNEFNWNEDALQKIYRKFDELV",
+    ]
+    expected = [_GetPseudoAAC(protein, lamda=5) for protein in proteins]
+    assert GetPseudoAACBatch(proteins, lamda=5) == expected
+    AAP = [_Hydrophobicity, _hydrophilicity]
+    expected = [GetPseudoAAC(protein, lamda=5, AAP=AAP) for protein in proteins]
+    assert GetPseudoAACBatch(proteins, lamda=5, AAP=AAP) == expected
+
+
+def test_batch_default_lamda():
+    proteins = ["MENATLLKSTTRHIRIFAAEIDRDGELVPSNQVLTLDIDPDNEFNWNEDALQKIYRKFDELV"]
+    assert GetPseudoAACBatch(proteins) == [_GetPseudoAAC(proteins[0])]
+    AAP = [_Hydrophobicity, _hydrophilicity]
+    assert GetPseudoAACBatch(proteins, AAP=AAP) == [GetPseudoAAC(proteins[0], AAP=AAP)]
+
+
+def test_invalid_sequence():
+    with pytest.raises(ValueError):
+        _GetPseudoAAC("ACDXEFGHIK", lamda=2)
+
+
+def test_batch_type2():
+    proteins = [
+        "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS",
+        "MENATLLKSTTRHIRIFAAEIDRDGELVPSNQVLTLDIDPDNEFNWNEDALQKIYRKFDELV",
+    ]
+    expected = [GetAPseudoAAC(protein, lamda=5) for protein in proteins]
+    assert GetAPseudoAACBatch(proteins, lamda=5) == expected
+
+
+def test_cache():
+    protein = "MENATLLKSTTRHIRIFAAEIDRDGELVPSNQVLTLDIDPDNEFNWNEDALQKIYRKFDELV"
+    expected = GetAPseudoAAC(protein, lamda=5)
+    result = GetAPseudoAAC(protein, lamda=5, cache=True)
+    assert result == expected
+    # The cached result must not be shared with the caller
+    result["APAAC1"] = None
+    assert GetAPseudoAAC(protein, lamda=5, cache=True) == expected
+    AAP = [_Hydrophobicity, _hydrophilicity]
+    expected = GetPseudoAAC(protein, lamda=5, AAP=AAP)
+    assert GetPseudoAAC(protein, lamda=5, AAP=AAP, cache=True) == expected
+
+
+def test_pseudo_aac_values():
+    # Pin some descriptors, so that numeric changes are noticed
+    protein = (
+        "MENATLLKSTTRHIRIFAAEIDRDGELVPSNQVLTLDIDPDNEFNWNEDALQKIYRKFDELV"
+        "EASSGADLTDYNLRRIGSDLEHYLRSLLQKGEISYNLSARVTNYSLGLPQVAVEDK"
+    )
+    paac = _GetPseudoAAC(protein, lamda=10, weight=0.05)
+    assert paac["PAAC1"] == 3.285
+    assert paac["PAAC20"] == 2.463
+    assert paac["PAAC21"] == 5.267
+    assert paac["PAAC30"] == 4.838
+    apaac = GetAPseudoAAC(protein, lamda=30, weight=0.5)
+    assert apaac["APAAC1"] == 4.546
+    assert apaac["APAAC21"] == -5.103
+    assert apaac["APAAC22"] == -3.379
+    assert apaac["APAAC65"] == -8.956
+    assert apaac["APAAC80"] == 1.103
+    # The normalization is close to zero for sequences only slightly longer
+    # than lamda, so the descriptors get large
+    protein = "VYRDKPQIIDANVFQSQSWMTSECATPNFLE"
+    apaac = GetAPseudoAAC(protein, lamda=30, weight=0.5)
+    assert apaac["APAAC1"] == 309.462
+    assert apaac["APAAC2"] == 154.731
+    assert apaac["APAAC21"] == 98.69
+    assert apaac["APAAC76"] == 3763.33
+    assert apaac["APAAC80"] == -2813.631
@@ -47,3 +47,87 @@ def test_main():
 
     print(cds.GetQSOp(maxlag=30, weight=0.1, distancematrix=proper))
     print(cds.GetSOCNp(maxlag=30, distancematrix=proper))
+
+
+def test_get_all_n_jobs():
+    # First party
+    from propy.PyPro import GetProDes
+
+    protein = "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS"
+    cds = GetProDes(protein)
+    expected = cds.GetALL()
+    result = cds.GetALL(n_jobs=2)
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+def test_memoize():
+    # First party
+    from propy.PyPro import GetProDes
+
+    protein = "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS"
+    cds = GetProDes(protein)
+    expected = cds.GetPAAC(lamda=5)
+    result = cds.GetPAAC(lamda=5)
+    assert result == expected
+    result["PAAC1"] = None
+    assert cds.GetPAAC(lamda=5) == expected
+    assert cds.GetPAAC(lamda=6) != expected
+
+
+def test_memoize_effective_parameters(monkeypatch):
+    # First party
+    from propy import PyPro
+
+    calls = []
+
+    def _GetPseudoAAC(ProteinSequence, **kwargs):
+        calls.append(kwargs)
+        return original(ProteinSequence, **kwargs)
+
+    original = PyPro._GetPseudoAAC
+    monkeypatch.setattr(PyPro, "_GetPseudoAAC", _GetPseudoAAC)
+    protein = "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS"
+    cds = PyPro.GetProDes(protein)
+    cds.GetPAAC()
+    cds.GetPAAC(10)
+    cds.GetPAAC(lamda=10, weight=0.05)
+    cds.GetALL()
+    assert len(calls) == 1
+
+
+def test_get_all_batch():
+    # First party
+    from propy.PyPro import GetALLBatch, GetProDes
+
+    proteins = [
+        "ADGCGVGEGTGQGPMCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQRVFCSFADEDAS",
+        "MENATLLKSTTRHIRIFAAEIDRDGELVPSNQVLTLDIDPDNEFNWNEDALQKIYRKFDELV",
+    ]
+    expected = [GetProDes(protein).GetALL(paac_lamda=5) for protein in proteins]
+    assert GetALLBatch(proteins, paac_lamda=5) == expected
+
+
+def test_empty_sequence():
+    # First party
+    from propy.PyPro import GetProDes
+
+    with pytest.raises(ValueError):
+        GetProDes("")
+
+
+def test_get_all_invalid_sequence():
+    # First party
+    from propy.PyPro import GetProDes
+
+    with pytest.raises(ValueError):
+        GetProDes("ADGCGVGEGTGQGPXCNCMCMKWVYADEDAADLESDSFADEDASLESDSFPWSNQ").GetALL()
+
+
+def test_get_all_short_sequence():
+    # First party
+    from propy.PyPro import GetProDes
+
+    with pytest.raises(ValueError):
+        GetProDes("ADGCGVGEG").GetALL()
+    assert len(GetProDes("ADGCGVGEG").GetALL(paac_lamda=5, apaac_lamda=5)) > 0
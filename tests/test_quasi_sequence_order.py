@@ -17,7 +17,12 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor,
 # Boston, MA  02110-1301, USA.
 # First party
-from propy.QuasiSequenceOrder import GetSequenceOrderCouplingNumberTotal
+from propy.QuasiSequenceOrder import (
+    GetQuasiSequenceOrder,
+    GetQuasiSequenceOrder1SW,
+    GetQuasiSequenceOrder2Grant,
+    GetSequenceOrderCouplingNumberTotal,
+)
 
 
 def test_main():
@@ -58,3 +63,13 @@ APTEVRRYTGGHERQKRVPFVVQSQHLLAGILQQQKNLLAAVEAQQQMLKLTIWGVK"
     # print(len(QSO))
     # for i in QSO:
     #     print(i, QSO[i])
+
+
+def test_quasi_sequence_order_taus():
+    protein = "ELRLRYCAPAGFALLKCNDADYDGFKTNCSNVSVVHCTNLMNTTVTTGLLLNGSYSENRT"
+    result = GetQuasiSequenceOrder(protein, maxlag=10)
+    assert len(result) == 2 * (20 + 10)
+    for key, value in GetQuasiSequenceOrder1SW(protein, maxlag=10).items():
+        assert result[key] == value
+    for key, value in GetQuasiSequenceOrder2Grant(protein, maxlag=10).items():
+        assert result[key] == value